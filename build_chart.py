@@ -2,16 +2,36 @@
 """
 Verification Markdown Chart Generator
 
-This CLI tool parses a single verification markdown file, extracts metadata,
+This CLI tool parses one or more verification markdown files, extracts metadata,
 and generates a corresponding HTML chart page for the dashboard.
 """
 
 import argparse
-import re
 import os
 import sys
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import List, Optional, Set, Tuple
+
+def match_meta_line(line: str, key: str) -> Optional[str]:
+    """
+    Matches a "- **Key**: value" metadata bullet using plain string operations.
+
+    Args:
+        line: The line to test, with leading whitespace already stripped.
+        key: The lowercase metadata key to look for, e.g. 'category'.
+
+    Returns:
+        The stripped value if the line declares the key, otherwise None.
+    """
+    if not line.startswith('-'):
+        return None
+    rest = line[1:].lstrip()
+    if not rest.startswith('**'):
+        return None
+    end = len(key) + 2
+    if rest[2:end].lower() != key or not rest.startswith('**:', end):
+        return None
+    return rest[end + 3:].strip()
 
 def parse_verification_file(filepath: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
     """
@@ -23,36 +43,30 @@ def parse_verification_file(filepath: str) -> Tuple[Optional[str], Optional[str]
     Returns:
         A tuple of (title, category, display_control). Values are None if not found.
     """
+    title = category = display_control = None
     try:
         with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # --- MODIFIED SECTION ---
-        # 1. Find Title (from Gherkin FEATURE tag)
-        # This now looks for "FEATURE: ..." instead of "# V: ..."
-        title_match = re.search(
-            r'^\s*FEATURE:\s*(.*)$',
-            content,
-            re.IGNORECASE | re.MULTILINE
-        )
-        title = title_match.group(1).strip() if title_match else None
-        # --- END OF MODIFIED SECTION ---
-
-        # 2. Find Category
-        category_match = re.search(
-            r'^\s*-\s*\*\*(?i:Category)\*\*:\s*(.*)$',
-            content,
-            re.MULTILINE
-        )
-        category = category_match.group(1).strip() if category_match else None
-
-        # 3. Find Display Control
-        control_match = re.search(
-            r'^\s*-\s*\*\*(?i:Display Control)\*\*:\s*(.*)$',
-            content,
-            re.MULTILINE
-        )
-        display_control = control_match.group(1).strip().lower() if control_match else None
+            # Single pass over the lines; cheap prefix checks pick out the few
+            # candidate lines, which are then matched with string operations.
+            for line in f:
+                stripped = line.lstrip()
+
+                # 1. Find Title (from Gherkin FEATURE tag)
+                if stripped[:8].upper() == 'FEATURE:':
+                    if title is None:
+                        title = stripped[8:].strip()
+
+                # 2. Find Category / 3. Find Display Control
+                elif stripped.startswith('-'):
+                    if category is None:
+                        category = match_meta_line(stripped, 'category')
+                    if display_control is None:
+                        value = match_meta_line(stripped, 'display control')
+                        if value is not None:
+                            display_control = value.lower()
+
+                if title is not None and category is not None and display_control is not None:
+                    break
 
         return title, category, display_control
 
@@ -65,138 +79,124 @@ def parse_verification_file(filepath: str) -> Tuple[Optional[str], Optional[str]
 
 # --- HTML Template Generators ---
 
-def generate_pie_chart_html(title: str, json_filename: str) -> str:
-    """
-    Generates the HTML content for a Pie Chart page.
-    Assumes JSON format: [{"model": "Name 1", "count": 10}, {"model": "Name 2", "count": 20}]
-    """
-    return f"""<!DOCTYPE html>
+# Templates are plain %-format strings built once at import: CSS/JS braces need
+# no escaping, but literal percent signs must be written as %%.
+#
+# Pages are written to dashboard/categories/<category>/ and load their shared
+# fetch error handling from dashboard/static/chart-errors.js.
+CHART_ERRORS_JS = Path(__file__).resolve().parent / 'dashboard' / 'static' / 'chart-errors.js'
+
+PIE_CHART_TEMPLATE = """<!DOCTYPE html>
 <html>
 <head>
-    <title>{title}</title>
+    <title>%(title)s</title>
     <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
     <style>
-        body {{ font-family: Arial, sans-serif; padding: 20px; max-width: 900px; margin: 0 auto; }}
-        h1 {{ text-align: center; color: #333; }}
-        #chartContainer {{ position: relative; height: 500px; margin-top: 20px; }}
-        .error-message {{ color: #D8000C; background-color: #FFD2D2; border: 1px solid #D8000C; padding: 15px; border-radius: 5px; text-align: left; }}
-        .error-message h2 {{ margin-top: 0; }}
-        .error-message code {{ background-color: #FFF; padding: 2px 5px; border-radius: 3px; }}
+        body { font-family: Arial, sans-serif; padding: 20px; max-width: 900px; margin: 0 auto; }
+        h1 { text-align: center; color: #333; }
+        #chartContainer { position: relative; height: 500px; margin-top: 20px; }
+        .error-message { color: #D8000C; background-color: #FFD2D2; border: 1px solid #D8000C; padding: 15px; border-radius: 5px; text-align: left; }
+        .error-message h2 { margin-top: 0; }
     </style>
+    <script src="../../static/chart-errors.js"></script>
 </head>
 <body>
-    <h1>{title}</h1>
+    <h1>%(title)s</h1>
     <div id="chartContainer">
         <canvas id="myChart"></canvas>
     </div>
     
     <script>
-        fetch('{json_filename}')
-            .then(response => {{
+        fetch('%(json)s')
+            .then(response => {
                 // Check if the response is ok (status 200-299)
-                if (!response.ok) {{
-                    throw new Error(`Network response was not ok: ${{response.status}} ${{response.statusText}}`);
-                }}
+                if (!response.ok) {
+                    throw new Error(`Network response was not ok: ${response.status} ${response.statusText}`);
+                }
                 return response.json();
-            }})
-            .then(data => {{
-                // Assumes data is like: [{{ "model": "SaaS", "count": 4 }}, ...]
+            })
+            .then(data => {
+                // Assumes data is like: [{ "model": "SaaS", "count": 4 }, ...]
                 const labels = data.map(item => item.model);
                 const values = data.map(item => item.count);
                 
                 // Dynamic color generation
-                const backgroundColors = values.map((_, i) => `hsl(${{i * 360 / values.length}}, 70%, 60%)`);
+                const backgroundColors = values.map((_, i) => `hsl(${i * 360 / values.length}, 70%%, 60%%)`);
                 
                 const ctx = document.getElementById('myChart');
-                new Chart(ctx, {{
+                new Chart(ctx, {
                     type: 'pie',
-                    data: {{
+                    data: {
                         labels: labels,
-                        datasets: [{{
+                        datasets: [{
                             label: 'Count',
                             data: values,
                             backgroundColor: backgroundColors,
                             borderWidth: 1
-                        }}]
-                    }},
-                    options: {{
+                        }]
+                    },
+                    options: {
                         responsive: true,
                         maintainAspectRatio: false,
-                        plugins: {{
-                            legend: {{ position: 'bottom' }},
-                            tooltip: {{
-                                callbacks: {{
-                                    label: function(context) {{
+                        plugins: {
+                            legend: { position: 'bottom' },
+                            tooltip: {
+                                callbacks: {
+                                    label: function(context) {
                                         return context.label + ': ' + context.parsed;
-                                    }}
-                                }}
-                            }}
-                        }}
-                    }}
-                }});
-            }})
-            .catch(error => {{
-                console.error('Error loading data:', error);
-                let errorMessage = `
-                    <div class="error-message">
-                        <h2>Error Loading Chart Data</h2>
-                        <p>Could not fetch or parse data from <code>{json_filename}</code>.</p>
-                        <p><strong>Possible Reason:</strong></p>`;
-                
-                if (error instanceof SyntaxError && error.message.includes("Unexpected token")) {{
-                    errorMessage += `<p>The file was found, but it is not valid JSON. This often happens if the file is missing and a 404 HTML page was returned instead.</p>`;
-                }} else if (error.message.includes("Network response was not ok")) {{
-                    errorMessage += `<p>The data file <code>{json_filename}</code> could not be found (e.g., 404 Not Found).</p>`;
-                }} else {{
-                    errorMessage += `<p>An unexpected error occurred: ${{error.message}}</p>`;
-                }}
-                
-                errorMessage += `<p>Please ensure the JSON file exists in the same directory as this HTML file and contains valid data.</p></div>`;
-                document.getElementById('chartContainer').innerHTML = errorMessage;
-            }});
+                                    }
+                                }
+                            }
+                        }
+                    }
+                });
+            })
+            .catch(error => window.renderChartError('chartContainer', '%(json)s', error));
     </script>
 </body>
 </html>
 """
 
-def generate_traffic_light_html(title: str, json_filename: str) -> str:
+def generate_pie_chart_html(title: str, json_filename: str) -> str:
     """
-    Generates the HTML content for a Traffic Light page.
-    Assumes JSON format: {{ "status": "Green" | "Amber" | "Red", "value": "99.5%" }}
+    Generates the HTML content for a Pie Chart page.
+    Assumes JSON format: [{"model": "Name 1", "count": 10}, {"model": "Name 2", "count": 20}]
     """
-    return f"""<!DOCTYPE html>
+    return PIE_CHART_TEMPLATE % {'title': title, 'json': json_filename}
+
+TRAFFIC_LIGHT_TEMPLATE = """<!DOCTYPE html>
 <html>
 <head>
-    <title>{title}</title>
+    <title>%(title)s</title>
     <style>
-        body {{ font-family: Arial, sans-serif; padding: 20px; text-align: center; }}
-        h1 {{ color: #333; }}
-        .traffic-light {{
+        body { font-family: Arial, sans-serif; padding: 20px; text-align: center; }
+        h1 { color: #333; }
+        .traffic-light {
             background: #222;
             display: inline-block;
             padding: 15px;
             border-radius: 20px;
             margin-top: 20px;
-        }}
-        .light {{
+        }
+        .light {
             width: 80px;
             height: 80px;
-            border-radius: 50%;
+            border-radius: 50%%;
             background: #444;
             margin: 10px;
             opacity: 0.3;
-        }}
-        .light.red {{ background-color: #F00; }}
-        .light.amber {{ background-color: #FF0; }}
-        .light.green {{ background-color: #0F0; }}
-        .light.on {{ opacity: 1; }}
-        h2 {{ margin-top: 20px; }}
-        .error-message {{ color: #D8000C; background-color: #FFD2D2; border: 1px solid #D8000C; padding: 15px; border-radius: 5px; text-align: left; max-width: 600px; margin: 20px auto; }}
-        .error-message code {{ background-color: #FFF; padding: 2px 5px; border-radius: 3px; }}
+        }
+        .light.red { background-color: #F00; }
+        .light.amber { background-color: #FF0; }
+        .light.green { background-color: #0F0; }
+        .light.on { opacity: 1; }
+        h2 { margin-top: 20px; }
+        .error-message { color: #D8000C; background-color: #FFD2D2; border: 1px solid #D8000C; padding: 15px; border-radius: 5px; text-align: left; max-width: 600px; margin: 20px auto; }
     </style>
+    <script src="../../static/chart-errors.js"></script>
 </head>
 <body>
-    <h1>{title}</h1>
+    <h1>%(title)s</h1>
     <div class="traffic-light">
         <div id="light-red" class="light red"></div>
         <div id="light-amber" class="light amber"></div>
@@ -205,63 +205,50 @@ def generate_traffic_light_html(title: str, json_filename: str) -> str:
     <h2 id="status-value">Loading...</h2>
     
     <script>
-        fetch('{json_filename}')
-            .then(response => {{
-                if (!response.ok) {{
-                    throw new Error(`Network response was not ok: ${{response.status}} ${{response.statusText}}`);
-                }}
+        fetch('%(json)s')
+            .then(response => {
+                if (!response.ok) {
+                    throw new Error(`Network response was not ok: ${response.status} ${response.statusText}`);
+                }
                 return response.json();
-            }})
-            .then(data => {{
-                // Assumes data is like: {{ "status": "Green", "value": "99.5%" }}
+            })
+            .then(data => {
+                // Assumes data is like: { "status": "Green", "value": "99.5%%" }
                 const status = data.status ? data.status.toLowerCase() : '';
                 const value = data.value || 'N/A';
                 
-                document.getElementById('status-value').innerText = `Status: ${{data.status || 'Unknown'}} (${{value}})`;
+                document.getElementById('status-value').innerText = `Status: ${data.status || 'Unknown'} (${value})`;
                 
-                if (status === 'green') {{
+                if (status === 'green') {
                     document.getElementById('light-green').classList.add('on');
-                }} else if (status === 'amber') {{
+                } else if (status === 'amber') {
                     document.getElementById('light-amber').classList.add('on');
-                }} else if (status === 'red') {{
+                } else if (status === 'red') {
                     document.getElementById('light-red').classList.add('on');
-                }}
-            }})
-            .catch(error => {{
-                console.error('Error loading data:', error);
-                let errorMessage = `
-                    <div class="error-message">
-                        <strong>Error Loading Status:</strong><br>`;
-                
-                if (error instanceof SyntaxError && error.message.includes("Unexpected token")) {{
-                    errorMessage += `Could not parse data from <code>{json_filename}</code>. It may be an HTML 404 page.`;
-                }} else if (error.message.includes("Network response was not ok")) {{
-                    errorMessage += `Data file <code>{json_filename}</code> could not be found.`;
-                }} else {{
-                    errorMessage += `An unexpected error occurred: ${{error.message}}`;
-                }}
-                errorMessage += `</div>`;
-                document.getElementById('status-value').innerHTML = errorMessage;
-            }});
+                }
+            })
+            .catch(error => window.renderChartError('status-value', '%(json)s', error));
     </script>
 </body>
 </html>
 """
 
-def generate_temperature_bar_html(title: str, json_filename: str) -> str:
+def generate_traffic_light_html(title: str, json_filename: str) -> str:
     """
-    Generates the HTML content for a Temperature Bar page.
-    Assumes JSON format: {{ "value": 95, "threshold_red": 90, "threshold_amber": 98 }}
+    Generates the HTML content for a Traffic Light page.
+    Assumes JSON format: {{ "status": "Green" | "Amber" | "Red", "value": "99.5%" }}
     """
-    return f"""<!DOCTYPE html>
+    return TRAFFIC_LIGHT_TEMPLATE % {'title': title, 'json': json_filename}
+
+TEMPERATURE_BAR_TEMPLATE = """<!DOCTYPE html>
 <html>
 <head>
-    <title>{title}</title>
+    <title>%(title)s</title>
     <style>
-        body {{ font-family: Arial, sans-serif; padding: 20px; text-align: center; }}
-        h1 {{ color: #333; }}
-        .bar-container {{
-            width: 80%;
+        body { font-family: Arial, sans-serif; padding: 20px; text-align: center; }
+        h1 { color: #333; }
+        .bar-container {
+            width: 80%%;
             max-width: 600px;
             height: 50px;
             background: #eee;
@@ -270,162 +257,272 @@ def generate_temperature_bar_html(title: str, json_filename: str) -> str:
             margin: 20px auto;
             position: relative;
             overflow: hidden;
-        }}
-        .bar-fill {{
-            height: 100%;
-            width: 0%; /* Set by JS */
+        }
+        .bar-fill {
+            height: 100%%;
+            width: 0%%; /* Set by JS */
             background-color: #ccc; /* Default/loading color */
             transition: width 0.5s ease, background-color 0.5s ease;
             position: absolute;
             left: 0;
             top: 0;
-        }}
-        .bar-label {{
+        }
+        .bar-label {
             position: absolute;
-            width: 100%;
+            width: 100%%;
             text-align: center;
             line-height: 50px;
             font-size: 1.2em;
             font-weight: bold;
             color: #000;
             text-shadow: 0 0 2px #fff;
-        }}
-        .bar-label.error {{
+        }
+        .bar-label.error {
             color: #D8000C;
             text-shadow: none;
             font-size: 1em;
             line-height: 1.2em;
             padding: 10px;
             box-sizing: border-box;
-        }}
+        }
     </style>
+    <script src="../../static/chart-errors.js"></script>
 </head>
 <body>
-    <h1>{title}</h1>
+    <h1>%(title)s</h1>
     <div class="bar-container">
         <div id="bar-fill" class="bar-fill"></div>
         <div id="bar-label" class="bar-label">Loading...</div>
     </div>
     
     <script>
-        fetch('{json_filename}')
-            .then(response => {{
-                if (!response.ok) {{
-                    throw new Error(`Network response was not ok: ${{response.status}} ${{response.statusText}}`);
-                }}
+        fetch('%(json)s')
+            .then(response => {
+                if (!response.ok) {
+                    throw new Error(`Network response was not ok: ${response.status} ${response.statusText}`);
+                }
                 return response.json();
-            }})
-            .then(data => {{
-                // Assumes data is like: {{ "value": 95, "threshold_red": 90, "threshold_amber": 98 }}
+            })
+            .then(data => {
+                // Assumes data is like: { "value": 95, "threshold_red": 90, "threshold_amber": 98 }
                 const value = data.value || 0;
                 const red = data.threshold_red || 90;
                 const amber = data.threshold_amber || 98;
                 
                 let color = '#d9534f'; // Red
-                if (value >= amber) {{
+                if (value >= amber) {
                     color = '#5cb85c'; // Green
-                }} else if (value >= red) {{
+                } else if (value >= red) {
                     color = '#f0ad4e'; // Amber
-                }}
+                }
                 
                 const fillElement = document.getElementById('bar-fill');
-                fillElement.style.width = value + '%';
+                fillElement.style.width = value + '%%';
                 fillElement.style.backgroundColor = color;
                 
-                document.getElementById('bar-label').innerText = value + '%';
-            }})
-            .catch(error => {{
+                document.getElementById('bar-label').innerText = value + '%%';
+            })
+            .catch(error => {
                 console.error('Error loading data:', error);
                 const labelElement = document.getElementById('bar-label');
                 labelElement.classList.add('error');
-                
-                if (error instanceof SyntaxError && error.message.includes("Unexpected token")) {{
-                    labelElement.innerText = `Error: Could not parse '{json_filename}'. File may be missing.`;
-                }} else if (error.message.includes("Network response was not ok")) {{
-                    labelElement.innerText = `Error: Could not find file '{json_filename}'.`;
-                }} else {{
-                    labelElement.innerText = `Error: ${{error.message}}`;
-                }}
-                
+                labelElement.innerText = 'Error: ' + window.chartErrorReason('%(json)s', error);
                 document.getElementById('bar-fill').style.backgroundColor = '#FADBD8';
-            }});
+            });
     </script>
 </body>
 </html>
 """
 
+def generate_temperature_bar_html(title: str, json_filename: str) -> str:
+    """
+    Generates the HTML content for a Temperature Bar page.
+    Assumes JSON format: {{ "value": 95, "threshold_red": 90, "threshold_amber": 98 }}
+    """
+    return TEMPERATURE_BAR_TEMPLATE % {'title': title, 'json': json_filename}
+
+def ensure_chart_helpers(project_root: Path) -> bool:
+    """
+    Copies the shared chart JavaScript into the project's dashboard/static
+    directory, refreshing a copy that differs from the shipped helper.
+
+    Args:
+        project_root: The project whose chart pages load the helper.
+
+    Returns:
+        True if the helper is in place, False if the shipped copy is missing.
+    """
+    try:
+        data = CHART_ERRORS_JS.read_bytes()
+    except FileNotFoundError:
+        return False
+    target = project_root / 'dashboard' / 'static' / CHART_ERRORS_JS.name
+    target.parent.mkdir(parents=True, exist_ok=True)
+    write_if_changed(target, data)
+    return True
+
+# Display control keyword -> HTML generator, tried in order against the control text
+CHART_GENERATORS = {
+    sys.intern('pie chart'): generate_pie_chart_html,
+    sys.intern('traffic light'): generate_traffic_light_html,
+    sys.intern('temperature bar'): generate_temperature_bar_html,
+}
+
+def write_if_changed(path: Path, data: bytes) -> bool:
+    """
+    Atomically replaces a file's contents, skipping the write if they are unchanged.
+
+    The data goes to a sibling temporary file that is then moved over the target
+    with os.replace, so the dashboard never serves a half-written page.
+
+    Args:
+        path: The file to write.
+        data: The complete new contents.
+
+    Returns:
+        True if the file was written, False if it already held the same bytes.
+    """
+    try:
+        if path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+
+    # The PID keeps concurrent runs from sharing a temporary file
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return True
+
+def write_log(lines: List[str]) -> None:
+    """
+    Writes the collected report lines to stdout in a single call and empties the list.
+
+    Args:
+        lines: The report lines, without trailing newlines.
+    """
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        lines.clear()
+
+def build_chart(filepath: str, created_dirs: Optional[Set[Path]] = None) -> bool:
+    """
+    Generates the HTML chart page for a single verification markdown file.
+
+    Args:
+        filepath: The path to the markdown file.
+        created_dirs: Directories already prepared during this run; used to
+            skip repeated mkdir calls and helper copies when batching files.
+
+    Returns:
+        True if the chart was written, False if generation failed.
+    """
+    md_file_path = Path(filepath)
+    
+    print(f"--> Processing: {md_file_path}")
+    
+    title, category, control = parse_verification_file(filepath)
+    
+    # The rest of the per-file report is collected here and written in one call
+    log = []
+    try:
+        if not title:
+            log.append(f"    **ERROR**: Could not find 'FEATURE:' name in {md_file_path.name}.")
+            log.append("    Generation failed.")
+            return False
+        if not category:
+            log.append(f"    **ERROR**: Could not find 'Category:' in {md_file_path.name}.")
+            log.append("    Generation failed.")
+            return False
+        if not control:
+            log.append(f"    **ERROR**: Could not find 'Display Control:' in {md_file_path.name}.")
+            log.append("    Generation failed.")
+            return False
+            
+        log.append(f"    - Title:   '{title}'")
+        log.append(f"    - Category: '{category}'")
+        log.append(f"    - Control:  '{control}'")
+        
+        # Determine paths
+        base_name = md_file_path.stem
+        json_filename = f"{base_name}.json"
+        html_filename = f"{base_name}.html"
+        
+        try:
+            # One abspath (a getcwd plus a lexical normpath) instead of resolve(),
+            # which lstat()s every path component
+            project_root = Path(os.path.dirname(os.path.dirname(os.path.abspath(filepath))))
+            # Batched runs see the same few categories repeatedly; interning keeps
+            # one shared string per category name
+            category_dir = project_root / 'dashboard' / 'categories' / sys.intern(category.lower())
+            
+            if created_dirs is None or category_dir not in created_dirs:
+                category_dir.mkdir(parents=True, exist_ok=True)
+                if created_dirs is not None:
+                    created_dirs.add(category_dir)
+            
+            output_html_path = category_dir / html_filename
+            
+            generator = next((fn for key, fn in CHART_GENERATORS.items() if key in control), None)
+            if generator is None:
+                log.append(f"    **WARNING**: No HTML template found for display control '{control}'. Skipping.")
+                return False
+            html_content = generator(title, json_filename)
+            
+            # Every page loads chart-errors.js from dashboard/static, which is
+            # refreshed once per project in a run
+            static_dir = project_root / 'dashboard' / 'static'
+            if created_dirs is None or static_dir not in created_dirs:
+                if not ensure_chart_helpers(project_root):
+                    log.append(f"    **WARNING**: Chart helper {CHART_ERRORS_JS} is missing; the generated pages cannot load it.")
+                if created_dirs is not None:
+                    created_dirs.add(static_dir)
+                
+            write_if_changed(output_html_path, html_content.encode('utf-8'))
+                
+            log.append(f"    V OK: Generated HTML chart at: {output_html_path.relative_to(project_root)}")
+            
+        except Exception as e:
+            # Emit what has been collected first so the error keeps its place
+            write_log(log)
+            print(f"    **ERROR**: Failed to write HTML file for {md_file_path.name}: {e}", file=sys.stderr, flush=False)
+            sys.stderr.flush()
+            return False
+
+        log.append(f"\nDone. Processed {md_file_path.name} successfully.")
+        return True
+    finally:
+        write_log(log)
+
 def main():
     """
     Main entry point for the CLI tool.
+    Processes every file given, so a whole directory of verification files
+    shares one interpreter start-up; exits non-zero if any file failed.
     """
     parser = argparse.ArgumentParser(
-        description="A CLI tool to generate an HTML chart from a single verification markdown file."
+        description="A CLI tool to generate HTML charts from one or more verification markdown files."
     )
     parser.add_argument(
-        'filepath',
-        help="Path to the single .md file to process. (e.g., verification/service-tag.md)"
+        'filepaths',
+        nargs='+',
+        help="Path(s) to the .md file(s) to process. (e.g., verification/service-tag.md)"
     )
     
     args = parser.parse_args()
     
-    md_file_path = Path(args.filepath)
-    
-    print(f"--> Processing: {md_file_path}")
-    
-    title, category, control = parse_verification_file(args.filepath)
-    
-    if not title:
-        print(f"    **ERROR**: Could not find 'FEATURE:' name in {md_file_path.name}.")
-        print("    Generation failed.")
-        sys.exit(1)
-    if not category:
-        print(f"    **ERROR**: Could not find 'Category:' in {md_file_path.name}.")
-        print("    Generation failed.")
-        sys.exit(1)
-    if not control:
-        print(f"    **ERROR**: Could not find 'Display Control:' in {md_file_path.name}.")
-        print("    Generation failed.")
-        sys.exit(1)
-        
-    print(f"    - Title:   '{title}'")
-    print(f"    - Category: '{category}'")
-    print(f"    - Control:  '{control}'")
+    failures = 0
+    created_dirs: Set[Path] = set()
+    for filepath in args.filepaths:
+        if not build_chart(filepath, created_dirs):
+            failures += 1
     
-    # Determine paths
-    base_name = md_file_path.stem
-    json_filename = f"{base_name}.json"
-    html_filename = f"{base_name}.html"
-    
-    try:
-        md_dir = md_file_path.parent.resolve()
-        project_root = md_dir.parent 
-        category_dir = project_root / 'dashboard' / 'categories' / category.lower()
-        
-        category_dir.mkdir(parents=True, exist_ok=True)
-        
-        output_html_path = category_dir / html_filename
-        
-        html_content = ""
-        if 'pie chart' in control:
-            html_content = generate_pie_chart_html(title, json_filename)
-        elif 'traffic light' in control:
-            html_content = generate_traffic_light_html(title, json_filename)
-        elif 'temperature bar' in control:
-            html_content = generate_temperature_bar_html(title, json_filename)
-        else:
-            print(f"    **WARNING**: No HTML template found for display control '{control}'. Skipping.")
-            sys.exit(1)
-            
-        with open(output_html_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-            
-        print(f"    V OK: Generated HTML chart at: {output_html_path.relative_to(project_root)}")
-        
-    except Exception as e:
-        print(f"    **ERROR**: Failed to write HTML file for {md_file_path.name}: {e}", file=sys.stderr)
+    if failures:
         sys.exit(1)
 
-    print(f"\nDone. Processed {md_file_path.name} successfully.")
-
 if __name__ == "__main__":
-    main()
+    main()
\ No newline at end of file
@@ -1,66 +1,137 @@
 # check_categories.py (Updated with auto-discovery)
 
 import argparse
+import mmap
 import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
-def find_category_from_content(content: str) -> str | None:
+# Compiled once at import so the auto-discovery loop doesn't re-resolve it per file.
+# The markup is pure ASCII, so re.ASCII keeps \s off the Unicode whitespace tables.
+CATEGORY_PATTERN = re.compile(r"^\s*-\s*\*\*(?i:Category)\*\*:\s*(.*)$", re.MULTILINE | re.ASCII)
+# Bytes twin of CATEGORY_PATTERN, used to scan memory-mapped files without decoding them
+CATEGORY_BYTES_PATTERN = re.compile(rb"^\s*-\s*\*\*(?i:Category)\*\*:\s*(.*)$", re.MULTILINE)
+# The verification template declares its metadata in the header, so one bounded
+# read usually finds the category without decoding or mapping the whole file
+HEADER_SCAN_BYTES = 8192
+
+def find_category_from_content(content: str | bytes) -> str | None:
     """
     Parses the content of a Markdown file to find the category.
 
     Args:
-        content: The string content of the Markdown file.
+        content: The content of the Markdown file, either as a string or as raw
+            UTF-8 bytes (including a memory-mapped file).
 
     Returns:
         The category string if found, otherwise None.
     """
-    category_pattern = re.compile(r"^\s*-\s*\*\*(?i:Category)\*\*:\s*(.*)$", re.MULTILINE)
-    
-    match = category_pattern.search(content)
+    if isinstance(content, str):
+        match = CATEGORY_PATTERN.search(content)
+        if match:
+            return match.group(1).strip()
+        return None
+
+    # Only the captured value is decoded, never the whole buffer
+    match = CATEGORY_BYTES_PATTERN.search(content)
     if match:
-        return match.group(1).strip()
+        return match.group(1).decode('utf-8').strip()
         
     return None
 
-def verify_directory_structure(filepath: str):
+def categories_root_for(base_dir: str) -> str:
+    """
+    Returns the normalised dashboard/categories directory for Markdown files in base_dir.
+
+    Args:
+        base_dir: The absolute directory containing the Markdown files.
+    """
+    return os.path.normpath(os.path.join(base_dir, '..', 'dashboard', 'categories'))
+
+def collect_directory_report(filepath: str, categories_root: str | None = None) -> tuple[list[str], list[str]]:
     """
     Reads a Markdown file, extracts its category, and verifies the
-    corresponding dashboard/categories directory exists.
+    corresponding dashboard/categories directory exists, collecting the
+    report instead of printing it so files can be checked concurrently.
     
     Args:
         filepath: The path to the Markdown file to process.
+        categories_root: The precomputed dashboard/categories directory. If None,
+            it is derived from the file's own location.
+
+    Returns:
+        A tuple of (stdout lines, stderr lines) for the file.
     """
-    print(f"--> Processing file: {filepath}")
+    out = [f"--> Processing file: {filepath}"]
+    err = []
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        category = find_category_from_content(content)
+        with open(filepath, 'rb') as f:
+            head = f.read(HEADER_SCAN_BYTES)
+            if len(head) < HEADER_SCAN_BYTES:
+                # The whole file fitted in the header read
+                category = find_category_from_content(head)
+            else:
+                # Drop the trailing partial line so a Category value split by
+                # the read boundary is never reported truncated
+                category = find_category_from_content(head[:head.rfind(b'\n') + 1])
+                if category is None:
+                    # Fall back to memory-mapping the file so the regex scans the
+                    # page cache directly rather than a decoded copy
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        category = find_category_from_content(mm)
         
         if not category:
-            print(f"    INFO: No category found in {filepath}")
-            return
+            out.append(f"    INFO: No category found in {filepath}")
+            return out, err
 
-        print(f"    - Found Category: '{category}'")
-        
-        category_dir_name = category.lower()
+        out.append(f"    - Found Category: '{category}'")
         
-        base_dir = os.path.dirname(os.path.abspath(filepath))
+        # Interned so repeated categories across a batch share one string
+        category_dir_name = sys.intern(category.lower())
         
-        expected_dir = os.path.join(base_dir, '..', 'dashboard', 'categories', category_dir_name)
+        if categories_root is None:
+            categories_root = categories_root_for(os.path.dirname(os.path.abspath(filepath)))
         
-        normalized_path = os.path.normpath(expected_dir)
+        # The root is already normalised, so a single join gives the final path
+        expected_dir = os.path.join(categories_root, category_dir_name)
         
         if not os.path.isdir(expected_dir):
-            print(f"    **WARNING**: Corresponding directory does not exist at: {normalized_path}\n")
+            out.append(f"    **WARNING**: Corresponding directory does not exist at: {expected_dir}\n")
         else:
-            print(f"    V OK: Directory found at: {normalized_path}\n")
+            out.append(f"    V OK: Directory found at: {expected_dir}\n")
             
     except FileNotFoundError:
-        print(f"**ERROR**: File not found at {filepath}\n", file=sys.stderr)
+        err.append(f"**ERROR**: File not found at {filepath}\n")
     except Exception as e:
-        print(f"**ERROR**: An unexpected error occurred while processing {filepath}: {e}\n", file=sys.stderr)
+        err.append(f"**ERROR**: An unexpected error occurred while processing {filepath}: {e}\n")
+    return out, err
+
+def write_report(out: list[str], err: list[str]) -> None:
+    """
+    Writes one file's collected report, each stream in a single call.
+
+    Args:
+        out: The stdout lines returned by collect_directory_report.
+        err: The stderr lines returned by collect_directory_report.
+    """
+    if out:
+        sys.stdout.write("\n".join(out) + "\n")
+    if err:
+        sys.stdout.flush()
+        sys.stderr.write("\n".join(err) + "\n")
+        sys.stderr.flush()
+
+def verify_directory_structure(filepath: str, categories_root: str | None = None):
+    """
+    Checks a single Markdown file and prints its report.
+    
+    Args:
+        filepath: The path to the Markdown file to process.
+        categories_root: The precomputed dashboard/categories directory. If None,
+            it is derived from the file's own location.
+    """
+    write_report(*collect_directory_report(filepath, categories_root))
 
 def main():
     """
@@ -87,10 +158,13 @@ def main():
     if not files_to_process:
         print("No filenames provided. Searching for Markdown files in the current directory...\n")
         try:
-            # Create a list of all files in the current directory that end with .md
-            files_to_process = [
-                f for f in os.listdir('.') if os.path.isfile(f) and f.endswith('.md')
-            ]
+            # Create a list of all files in the current directory that end with .md.
+            # scandir's cached entry type avoids a stat() per file, and the cheap
+            # suffix test runs first to skip non-Markdown entries entirely.
+            with os.scandir('.') as entries:
+                files_to_process = [
+                    entry.name for entry in entries if entry.name.endswith('.md') and entry.is_file()
+                ]
             if not files_to_process:
                 print("No Markdown files found.")
                 return
@@ -99,8 +173,23 @@ def main():
             return
             
     # Process either the user-provided list or the auto-discovered list.
+    # The categories root is computed once per source directory (auto-discovered
+    # files all share one) instead of re-deriving it from getcwd() for every file.
+    cwd = os.getcwd()
+    categories_roots = {}
+    file_roots = []
     for md_file in files_to_process:
-        verify_directory_structure(md_file)
+        base_dir = os.path.dirname(os.path.normpath(os.path.join(cwd, md_file)))
+        categories_root = categories_roots.get(base_dir)
+        if categories_root is None:
+            categories_root = categories_roots[base_dir] = categories_root_for(base_dir)
+        file_roots.append(categories_root)
+
+    # Each check is independent file I/O plus an isdir(), so run them on a thread
+    # pool. map() yields in submission order, keeping the output deterministic.
+    with ThreadPoolExecutor(max_workers=min(32, len(files_to_process))) as executor:
+        for out, err in executor.map(collect_directory_report, files_to_process, file_roots):
+            write_report(out, err)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,37 @@
+/*
+ * Shared error reporting for the chart pages generated by build_chart.py.
+ *
+ * Every generated page loads this script once and calls into it from the
+ * .catch() of its data fetch, so the error classification lives in one place
+ * instead of being embedded in each page.
+ */
+
+// Returns a plain-text explanation for why loading `filename` failed.
+window.chartErrorReason = function (filename, error) {
+    if (error instanceof SyntaxError && error.message.includes("Unexpected token")) {
+        return "The file '" + filename + "' was found, but it is not valid JSON. " +
+            "This often happens if the file is missing and a 404 HTML page was returned instead.";
+    }
+    if (error.message.includes("Network response was not ok")) {
+        return "The data file '" + filename + "' could not be found (e.g., 404 Not Found).";
+    }
+    return "An unexpected error occurred: " + error.message;
+};
+
+// Replaces the contents of the element `containerId` with an error panel.
+window.renderChartError = function (containerId, filename, error) {
+    console.error('Error loading data:', error);
+
+    const panel = document.createElement('div');
+    panel.className = 'error-message';
+
+    const heading = document.createElement('h2');
+    heading.textContent = 'Error Loading Chart Data';
+    const reason = document.createElement('p');
+    reason.textContent = window.chartErrorReason(filename, error);
+    const hint = document.createElement('p');
+    hint.textContent = 'Please ensure the JSON file exists in the same directory as this HTML file and contains valid data.';
+
+    panel.append(heading, reason, hint);
+    document.getElementById(containerId).replaceChildren(panel);
+};
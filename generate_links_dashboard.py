@@ -11,16 +11,449 @@ import argparse
 import json
 import os
 import sys
+import traceback
 from pathlib import Path
-from typing import Dict, List, Set, Tuple, Optional, Any
+from typing import AbstractSet, Dict, List, Set, Tuple, Optional, Any, Iterator, Union
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import yaml
 from datetime import datetime
 import re
+import string
+
+# Verification metadata patterns, compiled once rather than per parsed file.
+# They are bytes patterns: files are scanned undecoded and only the captured
+# values are decoded.
+CATEGORY_PATTERN = re.compile(rb'^\s*-\s*\*\*Category\*\*:\s*(.+)$', re.MULTILINE | re.IGNORECASE)
+DISPLAY_CONTROL_PATTERN = re.compile(rb'^\s*-\s*\*\*Display Control\*\*:\s*(.+)$', re.MULTILINE | re.IGNORECASE)
+THRESHOLDS_SECTION_PATTERN = re.compile(rb'\*\*Thresholds\*\*:(.*?)(?=^\s*-\s*\*\*|\Z)', re.MULTILINE | re.DOTALL)
+GREEN_THRESHOLD_PATTERN = re.compile(rb'\*\*Green\*\*:\s*([^*\n]+)')
+AMBER_THRESHOLD_PATTERN = re.compile(rb'\*\*Amber\*\*:\s*([^*\n]+)')
+RED_THRESHOLD_PATTERN = re.compile(rb'\*\*Red\*\*:\s*([^*\n]+)')
+
+# Escapes dynamic values (names, paths, metadata) for HTML text and attribute
+# context in one C-level pass; same replacements as html.escape()
+HTML_ESCAPE_TABLE = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#x27;',
+})
+
+# Shared default for link_graph lookups, so a miss doesn't allocate a new set
+EMPTY_SET: frozenset = frozenset()
+
+# Card markup, filled with %-formatting so each card is one substitution
+# (literal percent signs are written as %%)
+LINK_ITEM_TEMPLATE = '''
+                <div class="link-item">
+                    <span class="link-arrow">%(arrow)s</span>
+                    <span class="link-target">%(name)s</span>
+                    <span class="link-type-badge">%(layer)s</span>
+                </div>'''
+
+NO_LINKS_HTML = '<p style="color: #6c757d; font-style: italic;">No established links</p>'
+
+DOCUMENT_CARD_TEMPLATE = '''
+        <div class="document-card">
+            <div class="document-header">
+                <h3 class="document-name">%(name)s</h3>
+                <div class="link-status">
+                    <span class="link-badge incoming">↓ %(incoming)s</span>
+<span class="link-badge outgoing">↑ %(outgoing)s</span>
+%(link_state_badge)s
+                </div>
+            </div>
+            <div class="link-details">
+                <div class="link-list">
+                    %(link_list)s
+                </div>
+            </div>
+        </div>'''
+
+VERIFICATION_CARD_TEMPLATE = '''
+        <div class="document-card verification-card">
+            <div class="document-header">
+                <h3 class="document-name">%(name)s</h3>
+                <div class="link-status">
+                    <span class="link-badge incoming">↓ %(incoming)s</span>
+<span class="link-badge outgoing">↑ %(outgoing)s</span>
+
+                </div>
+            </div>
+            
+        <div class="verification-info">
+            <div class="verification-meta">
+                <span class="category-tag" style="background-color: %(category_color)s20; color: %(category_color)s;">
+                    %(category)s
+                </span>
+                <span class="display-type">%(display_control)s</span>
+            </div>
+            %(status_badge)s
+        </div>
+            %(result_links)s
+            <div class="link-details">
+                <div class="link-list">
+                    %(link_list)s
+                </div>
+            </div>
+        </div>'''
+
+NAV_ITEM_TEMPLATE = '''
+                <a href="#%(layer)s" class="nav-item %(layer)s">
+                    <span class="nav-icon">%(icon)s</span>
+                    <span class="nav-text">%(label)s</span>
+                    <span class="nav-count">%(count)s</span>
+                </a>'''
+
+# Page shell, split around the nav items and the layer sections so both can
+# be streamed between the parts. string.Template placeholders ($name) leave
+# the CSS and JavaScript braces as plain text.
+DASHBOARD_HEAD_TEMPLATE = string.Template('''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Architecture Documentation Dashboard - Enhanced</title>
+    <link rel="stylesheet" href="$stylesheet_href">
+</head>
+<body>
+    <div class="container">
+        <aside class="sidebar">
+            <div class="sidebar-header">
+                <h3>Architecture Layers</h3>
+            </div>
+            <nav class="sidebar-nav">
+                <a href="#overview" class="nav-item active">
+                    <span class="nav-icon">📊</span>
+                    <span class="nav-text">Overview</span>
+                </a>
+                ''')
+
+DASHBOARD_OVERVIEW_TEMPLATE = string.Template('''
+            </nav>
+        </aside>
+
+        <main class="main-content">
+            <header class="header">
+                <h1>Architecture Documentation Dashboard</h1>
+                <div class="subtitle">Links & Verification Results from ${project_dir_name}</div>
+            </header>
+
+            <section id="overview" class="layer-section">
+                <div class="stats-container">
+                    <div class="stat-card">
+                        <div class="stat-value">${total_documents}</div>
+                        <div class="stat-label">Total Documents</div>
+                    </div>
+                    <div class="stat-card" style="background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);">
+                        <div class="stat-value">${total_links}</div>
+                        <div class="stat-label">Total Links</div>
+                    </div>
+                    <div class="stat-card" style="background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%);">
+                        <div class="stat-value">${total_verifications}</div>
+                        <div class="stat-label">Verifications Run</div>
+                    </div>
+                    <div class="stat-card" style="background: linear-gradient(135deg, #43e97b 0%, #38f9d7 100%);">
+                        <div class="stat-value">${passed_verifications}/${total_verifications}</div>
+                        <div class="stat-label">Tests Passing</div>
+                    </div>
+                </div>
+            </section>
+
+            ''')
+
+DASHBOARD_TAIL_TEMPLATE = string.Template('''
+
+            <div class="footer">
+                <p>Enhanced Architecture Dashboard with Verification Results</p>
+                <p>Generated: ${timestamp}</p>
+                <p>Source: ${project_dir}</p>
+            </div>
+        </main>
+    </div>
+
+    <script>
+        document.addEventListener('DOMContentLoaded', function() {
+            const navItems = document.querySelectorAll('.nav-item');
+            const sections = document.querySelectorAll('section[id]');
+
+            navItems.forEach(item => {
+                item.addEventListener('click', function(e) {
+                    e.preventDefault();
+                    navItems.forEach(nav => nav.classList.remove('active'));
+                    this.classList.add('active');
+                    
+                    const targetId = this.getAttribute('href')?.substring(1);
+                    if (targetId) {
+                        const targetSection = document.getElementById(targetId);
+                        if (targetSection) {
+                            targetSection.scrollIntoView({ behavior: 'smooth' });
+                        }
+                    }
+                });
+            });
+        });
+    </script>
+</body>
+</html>''')
+
+# Base page styles, written once to the shared stylesheet next to the
+# dashboard instead of being inlined into every generated page
+DASHBOARD_CSS = '''
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; background-color: #f8f9fa; color: #333; line-height: 1.6; }
+        .container { display: flex; min-height: 100vh; }
+        .header { background: linear-gradient(135deg, #5a6fd8 0%, #4a5cc5 100%); color: white; padding: 1rem 2rem; position: fixed; top: 0; left: 280px; right: 0; z-index: 100; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+        .header h1 { font-size: 1.5rem; font-weight: 600; }
+        .header .subtitle { font-size: 0.9rem; opacity: 0.9; margin-top: 0.25rem; }
+        .sidebar { width: 280px; background: white; border-right: 1px solid #e9ecef; position: fixed; top: 0; left: 0; height: 100vh; overflow-y: auto; z-index: 200; }
+        .sidebar-header { padding: 1.5rem; border-bottom: 1px solid #e9ecef; background-color: #f8f9fa; }
+        .sidebar-header h3 { color: #495057; font-size: 1.1rem; font-weight: 600; }
+        .sidebar-nav { padding: 1rem 0; }
+        .nav-item { display: flex; align-items: center; padding: 0.75rem 1.5rem; color: #495057; text-decoration: none; transition: all 0.2s ease; border-left: 3px solid transparent; cursor: pointer; }
+        .nav-item:hover { background-color: #f8f9fa; color: #5a6fd8; }
+        .nav-item.active { background-color: #e3f2fd; color: #5a6fd8; border-left-color: #5a6fd8; }
+        .nav-icon { font-size: 1.2rem; margin-right: 0.75rem; width: 24px; text-align: center; }
+        .nav-text { font-weight: 500; font-size: 0.9rem; }
+        .nav-count { margin-left: auto; background-color: #e9ecef; color: #495057; padding: 0.2rem 0.5rem; border-radius: 12px; font-size: 0.75rem; font-weight: 600; }
+        .main-content { flex: 1; margin-left: 280px; margin-top: 80px; padding: 2rem; }
+        .layer-section { background: white; border-radius: 8px; padding: 2rem; margin-bottom: 2rem; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+        .layer-header { display: flex; align-items: center; gap: 1rem; margin-bottom: 1.5rem; }
+        .layer-title { font-size: 1.75rem; font-weight: 600; color: #2c3e50; }
+        .layer-badge { padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.75rem; font-weight: 600; text-transform: uppercase; }
+        .badge-domains { background-color: #cce5ff; color: #004085; }
+        .badge-principles { background-color: #d4edda; color: #155724; }
+        .badge-rules { background-color: #fff3cd; color: #856404; }
+        .badge-verification { background-color: #f8d7da; color: #721c24; }
+        .documents-grid { display: grid; grid-template-columns: repeat(auto-fill, minmax(320px, 1fr)); gap: 1.5rem; }
+        .document-card { background: #fff; border: 1px solid #e9ecef; border-radius: 8px; padding: 1.5rem; transition: all 0.2s ease; }
+        .document-card:hover { box-shadow: 0 4px 12px rgba(0,0,0,0.1); transform: translateY(-2px); }
+        .document-header { display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 1rem; }
+        .document-name { font-size: 1.1rem; font-weight: 600; color: #2c3e50; margin: 0; }
+        .link-status { display: flex; gap: 0.5rem; }
+        .link-badge { display: flex; align-items: center; gap: 0.25rem; padding: 0.2rem 0.5rem; border-radius: 12px; font-size: 0.75rem; font-weight: 600; }
+        .link-badge.incoming { background-color: #e3f2fd; color: #1976d2; }
+        .link-badge.outgoing { background-color: #f3e5f5; color: #7b1fa2; }
+        .link-badge.bidirectional { background-color: #e8f5e9; color: #388e3c; }
+        .link-badge.unidirectional { background-color: #fff3e0; color: #f57c00; }
+        .link-details { margin-top: 1rem; padding-top: 1rem; border-top: 1px solid #e9ecef; }
+        .link-list { font-size: 0.85rem; color: #6c757d; }
+        .link-item { display: flex; align-items: center; gap: 0.5rem; margin-bottom: 0.5rem; padding: 0.25rem 0; }
+        .link-arrow { font-size: 0.75rem; color: #adb5bd; }
+        .link-target { color: #5a6fd8; text-decoration: none; flex: 1; }
+        .link-type-badge { font-size: 0.65rem; padding: 0.1rem 0.3rem; border-radius: 4px; background-color: #f8f9fa; color: #6c757d; }
+        .stats-container { display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 1rem; margin-bottom: 2rem; }
+        .stat-card { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 1.5rem; border-radius: 8px; text-align: center; }
+        .stat-value { font-size: 2rem; font-weight: 700; margin-bottom: 0.5rem; }
+        .stat-label { font-size: 0.9rem; opacity: 0.9; }
+        .footer { margin-top: 3rem; padding: 1.5rem; text-align: center; color: #6c757d; background: white; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+'''
+
+# Enhanced CSS with verification-specific styles
+ENHANCED_CSS = '''
+        .verification-card { border-top: 3px solid #dc3545; }
+        .verification-info { padding: 1rem 0; border-bottom: 1px solid #e9ecef; }
+        .verification-meta { display: flex; gap: 0.5rem; margin-bottom: 0.5rem; }
+        .category-tag { padding: 0.25rem 0.5rem; border-radius: 4px; font-size: 0.75rem; font-weight: 600; text-transform: uppercase; }
+        .display-type { color: #6c757d; font-size: 0.85rem; }
+        .verification-badge { padding: 0.25rem 0.5rem; border-radius: 12px; font-size: 0.75rem; font-weight: 600; }
+        .verification-badge.passed { background-color: #d4edda; color: #155724; }
+        .verification-badge.failed { background-color: #f8d7da; color: #721c24; }
+        .verification-badge.pending { background-color: #fff3cd; color: #856404; }
+        .verification-badge.chart { background-color: #d1ecf1; color: #0c5460; }
+        .verification-badge.unknown { background-color: #e9ecef; color: #6c757d; }
+        .result-links { display: flex; gap: 0.5rem; margin-top: 0.5rem; }
+        .result-link { padding: 0.2rem 0.5rem; background: #f8f9fa; border-radius: 4px; text-decoration: none; color: #495057; font-size: 0.85rem; }
+        .result-link:hover { background: #e9ecef; }
+        .category-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 1rem; margin-bottom: 2rem; }
+        .category-summary-card { background: white; border-radius: 8px; padding: 1.5rem; border: 1px solid #e9ecef; }
+        .category-header { display: flex; justify-content: space-between; align-items: center; margin-bottom: 1rem; padding-left: 1rem; }
+        .category-header h4 { margin: 0; font-size: 1.1rem; }
+        .category-count { background: #f8f9fa; padding: 0.2rem 0.5rem; border-radius: 12px; font-size: 0.75rem; }
+        .category-stats { display: flex; gap: 1rem; }
+        .stat-item { padding: 0.25rem 0.5rem; border-radius: 4px; font-size: 0.85rem; }
+        .stat-item.passed { background: #d4edda; color: #155724; }
+        .stat-item.failed { background: #f8d7da; color: #721c24; }
+        .stat-item.pending { background: #fff3cd; color: #856404; }
+        '''
+
+# The stylesheet lives next to the dashboard so browsers can cache it, and
+# the page links to it by this relative path
+STYLESHEET_HREF = 'assets/dashboard.css'
+STYLESHEET = DASHBOARD_CSS + ENHANCED_CSS
+
+# libyaml's C loader is far faster than the pure-Python one; fall back when
+# PyYAML was built without it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+# orjson is optional; when present it reads and writes the JSON files
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def load_json_file(json_path: Union[str, Path]) -> Any:
+    """Parse a JSON file from its raw bytes, using orjson when available."""
+    with open(json_path, 'rb') as f:
+        raw = f.read()
+    if orjson:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # Stdlib json accepts a few non-standard values (NaN, Infinity)
+            # that orjson rejects
+            pass
+    return json.loads(raw)
+
+
+def dump_json_file(json_path: Path, data: Any) -> None:
+    """
+    Write data as indented JSON, using orjson when available.
+
+    Everything exported is already plain JSON types (paths are stored as
+    strings), so no default= hook is needed.
+    """
+    if orjson:
+        try:
+            json_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            return
+        except orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits, which stdlib json handles
+            pass
+    with open(json_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+
+
+def try_load_json_file(json_path: Union[str, Path]) -> Tuple[Any, Optional[Exception]]:
+    """Load a JSON file for a worker thread, returning (data, None) or (None, error)."""
+    try:
+        return load_json_file(json_path), None
+    except Exception as e:
+        return None, e
+
+
+def path_stem(path: str) -> str:
+    """
+    Return the stem of a '/'-separated path's final component.
+
+    Matches ``Path(path).stem`` for link paths without constructing a Path
+    for every edge.
+    """
+    name = path.rstrip('/').rsplit('/', 1)[-1]
+    dot = name.rfind('.')
+    return name[:dot] if 0 < dot < len(name) - 1 else name
+
+
+def classify_test_results(ver_data: Dict) -> str:
+    """
+    Classify a verification result by its gherkin-runner summary.
+
+    Returns 'pending' (no test results), 'no-summary', 'failed' (any failed
+    scenario), 'passed' (scenarios ran, none failed) or 'empty' (a summary
+    with no scenarios).
+    """
+    test_results = ver_data.get('test_results')
+    if test_results is None:
+        return 'pending'
+    if 'summary' not in test_results:
+        return 'no-summary'
+    scenarios = test_results['summary'].get('scenarios', {})
+    if scenarios.get('failed', 0) > 0:
+        return 'failed'
+    if scenarios.get('total', 0) > 0:
+        return 'passed'
+    return 'empty'
+
+
+def scan_files(directory: Union[str, Path], suffix: str) -> Iterator[os.DirEntry]:
+    """
+    Yield the directory entries whose names end with suffix.
+
+    Equivalent to ``Path(directory).glob('*' + suffix)`` (hidden files are
+    skipped the same way, and a missing directory yields nothing) but
+    without building a Path object per entry.
+    """
+    try:
+        entries = os.scandir(directory)
+    except FileNotFoundError:
+        return
+    with entries:
+        for entry in entries:
+            name = entry.name
+            if name.endswith(suffix) and not name.startswith('.'):
+                yield entry
+
+
+def write_if_changed(path: Path, data: bytes) -> bool:
+    """
+    Atomically replace a file's contents, skipping the write if they are unchanged.
+    
+    Returns True if the file was written, False if it already held the same bytes.
+    """
+    try:
+        if path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    
+    # The PID keeps concurrent runs from sharing a temporary file
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return True
+
+
+def load_yaml_cached(yaml_path: Path) -> Any:
+    """
+    Load a YAML file, reusing a JSON cache written next to it when still fresh.
+
+    The cache (``<name>.cache.json``) records the source file's size and
+    mtime, so any edit to the YAML invalidates it.
+    """
+    cache_path = yaml_path.with_name(yaml_path.name + '.cache.json')
+    st = yaml_path.stat()
+    
+    try:
+        cached = load_json_file(cache_path)
+        if cached.get('mtime_ns') == st.st_mtime_ns and cached.get('size') == st.st_size:
+            return cached['data']
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+    
+    with open(yaml_path, 'r', encoding='utf-8') as f:
+        data = yaml.load(f, Loader=YamlLoader)
+    
+    # The cache is best effort: unwritable directories or values JSON can't
+    # represent just mean the YAML is parsed again next time
+    try:
+        payload = {'mtime_ns': st.st_mtime_ns, 'size': st.st_size, 'data': data}
+        cache_path.write_bytes(orjson.dumps(payload) if orjson else json.dumps(payload).encode('utf-8'))
+    except (OSError, TypeError, ValueError):
+        pass
+    
+    return data
 
 class EnhancedDashboardGenerator:
     """Generates HTML dashboard from architecture document links and verification results."""
     
+    # Fixed attribute layout: the per-edge card loops read these constantly
+    __slots__ = (
+        'project_dir', 'output_file', 'stylesheet_file', 'link_graph', 'reverse_graph',
+        'bidirectional_edges', 'all_documents', 'document_metadata',
+        'verification_results', 'verification_charts', 'verification_status',
+        'doc_layer', 'sorted_documents', 'total_documents', 'cached_stats',
+    )
+    
     HIERARCHY = ['domains', 'principles', 'rules', 'verification']
     
     LAYER_COLORS = {
@@ -30,6 +463,21 @@ class EnhancedDashboardGenerator:
         'verification': {'bg': '#f8d7da', 'fg': '#721c24', 'accent': '#dc3545'}
     }
     
+    # CSS class for each layer's section badge (see .badge-* in the page shell)
+    LAYER_BADGE_CLASSES = {
+        'domains': 'badge-domains',
+        'principles': 'badge-principles',
+        'rules': 'badge-rules',
+        'verification': 'badge-verification'
+    }
+    
+    LAYER_NAV_ICONS = {
+        'domains': '🏛️',
+        'principles': '📐',
+        'rules': '📋',
+        'verification': '✓'
+    }
+    
     CATEGORY_COLORS = {
         'operations': '#17a2b8',
         'security': '#dc3545',
@@ -39,112 +487,167 @@ class EnhancedDashboardGenerator:
     }
     
     def __init__(self, project_dir: Path, output_file: Path = None):
-        self.project_dir = project_dir.resolve()
-        self.output_file = output_file or (self.project_dir / 'dashboard' / 'links-dashboard.html')
-        self.link_graph = defaultdict(set)
-        self.all_documents = defaultdict(set)
-        self.document_metadata = {}
-        self.verification_results = {}
-        self.verification_charts = {}
+        self.project_dir: Path = project_dir.resolve()
+        self.output_file: Path = output_file or (self.project_dir / 'dashboard' / 'links-dashboard.html')
+        self.stylesheet_file: Path = self.output_file.parent / STYLESHEET_HREF
+        # Source -> frozenset of targets, filled in by load_all_links()
+        self.link_graph: Dict[str, AbstractSet[str]] = {}
+        # Built from link_graph by build_link_indexes() once links are loaded
+        self.reverse_graph: Dict[str, List[str]] = defaultdict(list)
+        self.bidirectional_edges: Set[Tuple[str, str]] = set()
+        self.all_documents: Dict[str, AbstractSet[str]] = defaultdict(set)
+        self.document_metadata: Dict[str, Dict[str, Any]] = {}
+        self.verification_results: Dict[str, Dict[str, Any]] = {}
+        self.verification_charts: Dict[str, Dict[str, str]] = {}
+        # Verification name -> classify_test_results() status, set once results are loaded
+        self.verification_status: Dict[str, str] = {}
+        # Document name -> layer, built with the link indexes
+        self.doc_layer: Dict[str, str] = {}
+        # Layer -> document names in display order, built with the link indexes
+        self.sorted_documents: Dict[str, List[str]] = {}
+        # Document count across all layers, built with the link indexes
+        self.total_documents: int = 0
+        # calculate_stats() result, reset whenever links or results are reloaded
+        self.cached_stats: Optional[Dict] = None
         
     def load_verification_results(self) -> None:
         """Load verification results from dashboard/categories directories."""
+        self.cached_stats = None
         dashboard_dir = self.project_dir / 'dashboard' / 'categories'
         
-        if not dashboard_dir.exists():
+        # Opening the listing doubles as the existence check
+        try:
+            category_entries = os.scandir(dashboard_dir)
+        except FileNotFoundError:
             print(f"Warning: No dashboard/categories directory found at {dashboard_dir}")
             return
             
-        for category_dir in dashboard_dir.iterdir():
-            if not category_dir.is_dir():
+        # A single os.scandir pass per category sorts every entry by suffix.
+        # The listing's d_type avoids a stat() per entry, relative paths are
+        # joined from entry names rather than with relative_to(), and chart
+        # pages are found in the listing instead of by an exists() check.
+        categories = []
+        with category_entries:
+            for category_dir in category_entries:
+                if not category_dir.is_dir():
+                    continue
+                    
+                json_entries, stdout_entries, html_names = [], [], set()
+                with os.scandir(category_dir.path) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        if name.startswith('.'):
+                            continue
+                        if name.endswith('.json'):
+                            json_entries.append(entry)
+                        elif name.endswith('.stdout'):
+                            stdout_entries.append(entry)
+                        elif name.endswith('.html'):
+                            html_names.add(name)
+                categories.append((category_dir, json_entries, stdout_entries, html_names))
+        
+        json_jobs = [
+            (category_dir, entry, html_names)
+            for category_dir, json_entries, _, html_names in categories
+            for entry in json_entries
+        ]
+        stdout_jobs = [
+            (category_dir, entry)
+            for category_dir, _, stdout_entries, _ in categories
+            for entry in stdout_entries
+        ]
+        
+        # Reading and parsing is I/O-bound, so the files are loaded on a thread
+        # pool. map() returns results in submission order and the dictionaries
+        # are only updated here, so the outcome matches a serial load.
+        paths = [entry.path for _, entry, _ in json_jobs] + [entry.path for _, entry in stdout_jobs]
+        if not paths:
+            return
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4, len(paths))) as executor:
+            loaded = list(executor.map(try_load_json_file, paths))
+        
+        # All .json results are processed before any .stdout file so test
+        # results attach to a result from any category, as before
+        for (category_dir, json_entry, html_names), (data, error) in zip(json_jobs, loaded):
+            json_file = json_entry.path
+            if error is not None:
+                print(f"Error loading verification result {json_file}: {error}")
                 continue
-                
+            
             category_name = category_dir.name.lower()
+            category_rel = os.path.join('dashboard', 'categories', category_dir.name)
+            verification_name = json_entry.name[:-len('.json')]
             
-            # Look for JSON result files (*.json)
-            for json_file in category_dir.glob('*.json'):
-                verification_name = json_file.stem
-                
-                try:
-                    with open(json_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        
-                    # Store the verification result
-                    self.verification_results[verification_name] = {
-                        'category': category_name,
-                        'data': data,
-                        'json_file': str(json_file.relative_to(self.project_dir))
-                    }
-                    
-                    # Check for corresponding HTML chart
-                    html_file = json_file.with_suffix('.html')
-                    if html_file.exists():
-                        self.verification_charts[verification_name] = {
-                            'html_file': str(html_file.relative_to(self.project_dir)),
-                            'category': category_name
-                        }
-                        
-                except Exception as e:
-                    print(f"Error loading verification result {json_file}: {e}")
+            # Store the verification result
+            self.verification_results[verification_name] = {
+                'category': category_name,
+                'data': data,
+                'json_file': os.path.join(category_rel, json_entry.name)
+            }
+            
+            # Check for corresponding HTML chart
+            html_name = verification_name + '.html'
+            if html_name in html_names:
+                self.verification_charts[verification_name] = {
+                    'html_file': os.path.join(category_rel, html_name),
+                    'category': category_name
+                }
         
-        # Also look for .stdout files which contain the full test results
-        for category_dir in dashboard_dir.iterdir():
-            if not category_dir.is_dir():
+        # Also attach the .stdout files, which contain the full test results
+        for (category_dir, stdout_entry), (test_results, error) in zip(stdout_jobs, loaded[len(json_jobs):]):
+            stdout_file = stdout_entry.path
+            if error is not None:
+                print(f"Error loading test results {stdout_file}: {error}")
                 continue
-                
-            for stdout_file in category_dir.glob('*.stdout'):
-                verification_name = stdout_file.stem
-                
-                try:
-                    with open(stdout_file, 'r', encoding='utf-8') as f:
-                        test_results = json.load(f)
-                        
-                    if verification_name in self.verification_results:
-                        self.verification_results[verification_name]['test_results'] = test_results
-                    else:
-                        self.verification_results[verification_name] = {
-                            'category': category_dir.name.lower(),
-                            'test_results': test_results,
-                            'stdout_file': str(stdout_file.relative_to(self.project_dir))
-                        }
-                        
-                except Exception as e:
-                    print(f"Error loading test results {stdout_file}: {e}")
+            
+            verification_name = stdout_entry.name[:-len('.stdout')]
+            
+            if verification_name in self.verification_results:
+                self.verification_results[verification_name]['test_results'] = test_results
+            else:
+                self.verification_results[verification_name] = {
+                    'category': category_dir.name.lower(),
+                    'test_results': test_results,
+                    'stdout_file': os.path.join('dashboard', 'categories', category_dir.name, stdout_entry.name)
+                }
+        
+        # Classify each result once for the stats, badges and summary
+        self.verification_status = {
+            name: classify_test_results(ver_data) for name, ver_data in self.verification_results.items()
+        }
     
     def parse_verification_metadata(self) -> None:
         """Parse verification markdown files to extract metadata."""
         verification_dir = self.project_dir / 'verification'
         
-        if not verification_dir.exists():
-            return
-            
-        for md_file in verification_dir.glob('*.md'):
-            verification_name = md_file.stem
+        for md_entry in scan_files(verification_dir, '.md'):
+            md_file = md_entry.path
+            verification_name = md_entry.name[:-len('.md')]
             
             try:
-                with open(md_file, 'r', encoding='utf-8') as f:
+                with open(md_file, 'rb') as f:
                     content = f.read()
                 
                 # Extract category
-                category_match = re.search(r'^\s*-\s*\*\*Category\*\*:\s*(.+)$', content, re.MULTILINE | re.IGNORECASE)
-                category = category_match.group(1).strip().lower() if category_match else None
+                category_match = CATEGORY_PATTERN.search(content)
+                category = category_match.group(1).decode('utf-8').strip().lower() if category_match else None
                 
                 # Extract display control
-                control_match = re.search(r'^\s*-\s*\*\*Display Control\*\*:\s*(.+)$', content, re.MULTILINE | re.IGNORECASE)
-                display_control = control_match.group(1).strip().lower() if control_match else None
+                control_match = DISPLAY_CONTROL_PATTERN.search(content)
+                display_control = control_match.group(1).decode('utf-8').strip().lower() if control_match else None
                 
                 # Extract thresholds
                 thresholds = {}
-                threshold_section = re.search(r'\*\*Thresholds\*\*:(.*?)(?=^\s*-\s*\*\*|\Z)', content, re.MULTILINE | re.DOTALL)
+                threshold_section = THRESHOLDS_SECTION_PATTERN.search(content)
                 if threshold_section:
                     threshold_text = threshold_section.group(1)
-                    green_match = re.search(r'\*\*Green\*\*:\s*([^*\n]+)', threshold_text)
-                    amber_match = re.search(r'\*\*Amber\*\*:\s*([^*\n]+)', threshold_text)
-                    red_match = re.search(r'\*\*Red\*\*:\s*([^*\n]+)', threshold_text)
+                    green_match = GREEN_THRESHOLD_PATTERN.search(threshold_text)
+                    amber_match = AMBER_THRESHOLD_PATTERN.search(threshold_text)
+                    red_match = RED_THRESHOLD_PATTERN.search(threshold_text)
                     
-                    if green_match: thresholds['green'] = green_match.group(1).strip()
-                    if amber_match: thresholds['amber'] = amber_match.group(1).strip()
-                    if red_match: thresholds['red'] = red_match.group(1).strip()
+                    if green_match: thresholds['green'] = green_match.group(1).decode('utf-8').strip()
+                    if amber_match: thresholds['amber'] = amber_match.group(1).decode('utf-8').strip()
+                    if red_match: thresholds['red'] = red_match.group(1).decode('utf-8').strip()
                 
                 # Store metadata
                 if verification_name not in self.document_metadata:
@@ -161,38 +664,37 @@ class EnhancedDashboardGenerator:
     
     def load_all_links(self) -> None:
         """Load all links from links.yaml files across the project."""
+        self.cached_stats = None
+        # Thaw any earlier load's frozen sets so documents can be added again
+        self.all_documents = defaultdict(set, {layer: set(docs) for layer, docs in self.all_documents.items()})
+        
         # First, scan for all markdown files in the hierarchy
         for layer in self.HIERARCHY:
-            layer_dir = self.project_dir / layer
-            if layer_dir.exists():
-                for md_file in layer_dir.glob('*.md'):
-                    doc_name = md_file.stem
-                    self.all_documents[layer].add(doc_name)
-                    self.document_metadata[doc_name] = {'layer': layer}
+            for md_entry in scan_files(self.project_dir / layer, '.md'):
+                doc_name = sys.intern(md_entry.name[:-len('.md')])
+                self.all_documents[layer].add(doc_name)
+                self.document_metadata[doc_name] = {'layer': layer}
         
         # Parse verification metadata
         self.parse_verification_metadata()
         
-        # Then load the links
+        # Then load the links. Targets are appended to plain lists (seeded from
+        # any earlier load) and deduplicated once when the graph is frozen.
+        links: Dict[str, List[str]] = {source: list(targets) for source, targets in self.link_graph.items()}
         for layer in self.HIERARCHY:
-            layer_dir = self.project_dir / layer
-            if not layer_dir.exists():
-                continue
-                
-            links_yaml_path = layer_dir / 'links.yaml'
-            if not links_yaml_path.exists():
-                continue
+            links_yaml_path = self.project_dir / layer / 'links.yaml'
                 
             try:
-                with open(links_yaml_path, 'r', encoding='utf-8') as f:
-                    data = yaml.safe_load(f) or {}
+                # A missing layer directory or links.yaml surfaces here as
+                # FileNotFoundError, so no separate exists() checks are needed
+                data = load_yaml_cached(links_yaml_path) or {}
                     
                 established = data.get('established_links', {})
                 for source_file, targets in established.items():
                     if not targets:
                         continue
                         
-                    source_name = Path(source_file).stem
+                    source_name = sys.intern(path_stem(source_file))
                     self.all_documents[layer].add(source_name)
                     if source_name not in self.document_metadata:
                         self.document_metadata[source_name] = {'layer': layer}
@@ -200,53 +702,93 @@ class EnhancedDashboardGenerator:
                     for target in targets:
                         # Normalize Windows paths to forward slashes
                         normalized_target = target.replace('\\', '/')
-                        target_path = Path(normalized_target)
-                        target_name = target_path.stem
-                        
-                        # Determine target layer from path components
-                        target_layer = None
-                        path_str = normalized_target.lower()
+                        # Names recur across many links; interning keeps one
+                        # copy of each and lets lookups hit the identity check
+                        target_name = sys.intern(path_stem(normalized_target))
                         
-                        for l in self.HIERARCHY:
-                            if f'../{l}/' in path_str or f'/{l}/' in path_str or path_str.startswith(f'{l}/'):
-                                target_layer = l
-                                break
+                        # Determine target layer from path components: the first
+                        # layer (in hierarchy order) naming one of the target's
+                        # directories
+                        dir_parts = set(normalized_target.lower().split('/')[:-1])
+                        target_layer = next((l for l in self.HIERARCHY if l in dir_parts), None)
                         
                         if target_layer:
-                            self.link_graph[source_name].add(target_name)
+                            links.setdefault(source_name, []).append(target_name)
                             self.all_documents[target_layer].add(target_name)
                             if target_name not in self.document_metadata:
                                 self.document_metadata[target_name] = {'layer': target_layer}
                             
+            except FileNotFoundError:
+                continue
             except Exception as e:
                 print(f"Error loading links from {links_yaml_path}: {e}", file=sys.stderr)
+        
+        # Loading is done: freeze the graphs so rendering only ever reads them
+        # and a stray write fails loudly instead of inserting an empty entry
+        # Sources with identical targets share one frozenset object
+        shared_targets: Dict[frozenset, frozenset] = {}
+        self.link_graph = {
+            source: shared_targets.setdefault(frozen, frozen)
+            for source, targets in links.items()
+            for frozen in (frozenset(targets),)
+        }
+        self.all_documents = {layer: frozenset(docs) for layer, docs in self.all_documents.items()}
+        
+        self.build_link_indexes()
     
-    def calculate_stats(self) -> Dict:
-        """Calculate dashboard statistics including verification results."""
-        # Count incoming links
-        incoming_counts = defaultdict(int)
+    def build_link_indexes(self) -> None:
+        """Index incoming links, bidirectional edges, document layers and per-layer order for card generation."""
+        self.reverse_graph = defaultdict(list)
+        self.bidirectional_edges = set()
+        # Flat name -> layer map, so each card edge is a single dict lookup
+        self.doc_layer = {name: meta.get('layer', 'unknown') for name, meta in self.document_metadata.items()}
+        # Each layer's documents are sorted once here rather than per render
+        self.sorted_documents = {layer: sorted(docs) for layer, docs in self.all_documents.items()}
+        self.total_documents = sum(len(docs) for docs in self.all_documents.values())
+        
+        # Sources are appended in link_graph order, matching the order a full
+        # scan of link_graph would find them in
         for source, targets in self.link_graph.items():
             for target in targets:
-                incoming_counts[target] += 1
+                self.reverse_graph[target].append(source)
+                if source in self.link_graph.get(target, EMPTY_SET):
+                    self.bidirectional_edges.add((source, target))
+    
+    def calculate_stats(self) -> Dict:
+        """
+        Calculate dashboard statistics including verification results.
         
-        # Calculate bidirectional links
+        The result is cached until links or verification results are reloaded,
+        so rendering the page and the --json export share one computation.
+        """
+        if self.cached_stats is not None:
+            return self.cached_stats
+        
+        # Count incoming links, bidirectional links and linked documents in
+        # one pass over the edges
+        incoming_counts = defaultdict(int)
         bidirectional_count = 0
-        unidirectional_links = []
+        unidirectional_count = 0
+        linked_docs = set()
         
         for source, targets in self.link_graph.items():
+            linked_docs.add(source)
             for target in targets:
-                if source in self.link_graph.get(target, set()):
+                incoming_counts[target] += 1
+                linked_docs.add(target)
+                if source in self.link_graph.get(target, EMPTY_SET):
                     bidirectional_count += 1
                 else:
-                    unidirectional_links.append((source, target))
+                    unidirectional_count += 1
         
         # Actual bidirectional pairs (divide by 2 as we count each direction)
         bidirectional_count //= 2
         
-        total_docs = sum(len(docs) for docs in self.all_documents.values())
+        total_docs = self.total_documents
         total_links = sum(len(targets) for targets in self.link_graph.values())
         
-        docs_with_links = len(self.link_graph) + len(incoming_counts)
+        # A document that both links and is linked to counts once
+        docs_with_links = len(linked_docs)
         coverage = (docs_with_links / total_docs * 100) if total_docs > 0 else 0
         
         # Calculate verification statistics
@@ -254,21 +796,18 @@ class EnhancedDashboardGenerator:
         passed_verifications = 0
         failed_verifications = 0
         
-        for ver_name, ver_data in self.verification_results.items():
-            if 'test_results' in ver_data:
-                test_results = ver_data['test_results']
-                if 'summary' in test_results:
-                    scenarios = test_results['summary'].get('scenarios', {})
-                    if scenarios.get('failed', 0) == 0 and scenarios.get('total', 0) > 0:
-                        passed_verifications += 1
-                    else:
-                        failed_verifications += 1
-        
-        return {
+        for ver_name in self.verification_results:
+            status = self.verification_status.get(ver_name)
+            if status == 'passed':
+                passed_verifications += 1
+            elif status in ('failed', 'empty'):
+                failed_verifications += 1
+        
+        self.cached_stats = {
             'total_documents': total_docs,
             'total_links': total_links,
             'bidirectional_links': bidirectional_count,
-            'unidirectional_links': len(unidirectional_links),
+            'unidirectional_links': unidirectional_count,
             'link_coverage': round(coverage, 1),
             'incoming_counts': dict(incoming_counts),
             'total_verifications': total_verifications,
@@ -276,23 +815,19 @@ class EnhancedDashboardGenerator:
             'failed_verifications': failed_verifications,
             'verification_coverage': round((total_verifications / len(self.all_documents.get('verification', [])) * 100), 1) if self.all_documents.get('verification') else 0
         }
+        return self.cached_stats
     
     def generate_verification_status_badge(self, doc_name: str) -> str:
         """Generate a status badge for verification documents."""
         if doc_name not in self.verification_results:
             return '<span class="verification-badge pending">⏳ Not Run</span>'
         
-        ver_data = self.verification_results[doc_name]
-        
         # Check test results
-        if 'test_results' in ver_data:
-            test_results = ver_data['test_results']
-            if 'summary' in test_results:
-                scenarios = test_results['summary'].get('scenarios', {})
-                if scenarios.get('failed', 0) > 0:
-                    return '<span class="verification-badge failed">❌ Failed</span>'
-                elif scenarios.get('total', 0) > 0:
-                    return '<span class="verification-badge passed">✅ Passed</span>'
+        status = self.verification_status.get(doc_name)
+        if status == 'failed':
+            return '<span class="verification-badge failed">❌ Failed</span>'
+        elif status == 'passed':
+            return '<span class="verification-badge passed">✅ Passed</span>'
         
         # Check for chart availability
         if doc_name in self.verification_charts:
@@ -300,6 +835,29 @@ class EnhancedDashboardGenerator:
         
         return '<span class="verification-badge unknown">❓ Unknown</span>'
     
+    def generate_link_list(self, doc_name: str, outgoing) -> str:
+        """Render a card's link rows: sorted outgoing links, then incoming-only ones."""
+        doc_layer = self.doc_layer
+        bidirectional_edges = self.bidirectional_edges
+        
+        link_items = [
+            LINK_ITEM_TEMPLATE % {
+                'arrow': '↔' if (doc_name, target) in bidirectional_edges else '→',
+                'name': target.translate(HTML_ESCAPE_TABLE),
+                'layer': doc_layer.get(target, 'unknown'),
+            }
+            for target in sorted(outgoing)
+        ]
+        
+        # Add incoming-only links
+        link_items.extend(
+            LINK_ITEM_TEMPLATE % {'arrow': '←', 'name': source.translate(HTML_ESCAPE_TABLE), 'layer': doc_layer.get(source, 'unknown')}
+            for source in self.reverse_graph.get(doc_name, ())
+            if source not in outgoing
+        )
+        
+        return ''.join(link_items) if link_items else NO_LINKS_HTML
+    
     def generate_verification_card(self, doc_name: str, stats: Dict) -> str:
         """Generate an enhanced card for verification documents."""
         metadata = self.document_metadata.get(doc_name, {})
@@ -307,85 +865,31 @@ class EnhancedDashboardGenerator:
         display_control = metadata.get('display_control', 'unknown')
         
         # Get link information
-        outgoing = self.link_graph.get(doc_name, set())
+        outgoing = self.link_graph.get(doc_name, EMPTY_SET)
         incoming = stats['incoming_counts'].get(doc_name, 0)
         
-        # Get verification status
-        status_badge = self.generate_verification_status_badge(doc_name)
-        
-        # Generate link status badges
-        status_badges = f'<span class="link-badge incoming">↓ {incoming}</span>\n'
-        status_badges += f'<span class="link-badge outgoing">↑ {len(outgoing)}</span>\n'
-        
-        # Add verification-specific information
-        verification_info = f'''
-        <div class="verification-info">
-            <div class="verification-meta">
-                <span class="category-tag" style="background-color: {self.CATEGORY_COLORS.get(category, '#6c757d')}20; color: {self.CATEGORY_COLORS.get(category, '#6c757d')};">
-                    {category.capitalize()}
-                </span>
-                <span class="display-type">{display_control.replace('_', ' ').title()}</span>
-            </div>
-            {status_badge}
-        </div>'''
-        
         # Add links to results if available
         result_links = []
-        if doc_name in self.verification_results:
-            ver_data = self.verification_results[doc_name]
-            if 'json_file' in ver_data:
-                result_links.append(f'<a href="{ver_data["json_file"]}" class="result-link">📄 Data</a>')
-        
-        if doc_name in self.verification_charts:
-            chart_data = self.verification_charts[doc_name]
-            result_links.append(f'<a href="{chart_data["html_file"]}" class="result-link">📊 Chart</a>')
+        ver_data = self.verification_results.get(doc_name)
+        if ver_data is not None and 'json_file' in ver_data:
+            result_links.append(f'<a href="{ver_data["json_file"].translate(HTML_ESCAPE_TABLE)}" class="result-link">📄 Data</a>')
         
-        result_links_html = ' '.join(result_links) if result_links else ''
+        chart_data = self.verification_charts.get(doc_name)
+        if chart_data is not None:
+            result_links.append(f'<a href="{chart_data["html_file"].translate(HTML_ESCAPE_TABLE)}" class="result-link">📊 Chart</a>')
         
-        # Generate link list
-        link_items = []
-        for target in sorted(outgoing):
-            target_layer = self.document_metadata.get(target, {}).get('layer', 'unknown')
-            if doc_name in self.link_graph.get(target, set()):
-                arrow = '↔'
-            else:
-                arrow = '→'
-            link_items.append(f'''
-                <div class="link-item">
-                    <span class="link-arrow">{arrow}</span>
-                    <span class="link-target">{target}</span>
-                    <span class="link-type-badge">{target_layer}</span>
-                </div>''')
-        
-        # Add incoming-only links
-        for source, targets in self.link_graph.items():
-            if doc_name in targets and source not in outgoing:
-                source_layer = self.document_metadata.get(source, {}).get('layer', 'unknown')
-                link_items.append(f'''
-                <div class="link-item">
-                    <span class="link-arrow">←</span>
-                    <span class="link-target">{source}</span>
-                    <span class="link-type-badge">{source_layer}</span>
-                </div>''')
-        
-        link_list = ''.join(link_items) if link_items else '<p style="color: #6c757d; font-style: italic;">No established links</p>'
-        
-        return f'''
-        <div class="document-card verification-card">
-            <div class="document-header">
-                <h3 class="document-name">{doc_name}</h3>
-                <div class="link-status">
-                    {status_badges}
-                </div>
-            </div>
-            {verification_info}
-            {f'<div class="result-links">{result_links_html}</div>' if result_links_html else ''}
-            <div class="link-details">
-                <div class="link-list">
-                    {link_list}
-                </div>
-            </div>
-        </div>'''
+        return VERIFICATION_CARD_TEMPLATE % {
+            'name': doc_name.translate(HTML_ESCAPE_TABLE),
+            'incoming': incoming,
+            'outgoing': len(outgoing),
+            # Looked up once; the template uses it for both the tint and the text
+            'category_color': self.CATEGORY_COLORS.get(category, '#6c757d'),
+            'category': category.capitalize().translate(HTML_ESCAPE_TABLE),
+            'display_control': display_control.replace('_', ' ').title().translate(HTML_ESCAPE_TABLE),
+            'status_badge': self.generate_verification_status_badge(doc_name),
+            'result_links': f'<div class="result-links">{" ".join(result_links)}</div>' if result_links else '',
+            'link_list': self.generate_link_list(doc_name, outgoing),
+        }
     
     def generate_document_card(self, doc_name: str, layer: str, stats: Dict) -> str:
         """Generate HTML for a single document card."""
@@ -394,66 +898,26 @@ class EnhancedDashboardGenerator:
             return self.generate_verification_card(doc_name, stats)
         
         # Standard card for other layers
-        outgoing = self.link_graph.get(doc_name, set())
+        outgoing = self.link_graph.get(doc_name, EMPTY_SET)
         incoming = stats['incoming_counts'].get(doc_name, 0)
         
-        # Determine link status
-        has_bidirectional = False
-        for target in outgoing:
-            if doc_name in self.link_graph.get(target, set()):
-                has_bidirectional = True
-                break
-        
-        status_badges = f'<span class="link-badge incoming">↓ {incoming}</span>\n'
-        status_badges += f'<span class="link-badge outgoing">↑ {len(outgoing)}</span>\n'
+        # Determine link status: bidirectional if any target links back here
+        has_bidirectional = not outgoing.isdisjoint(self.reverse_graph.get(doc_name, ()))
         
         if has_bidirectional:
-            status_badges += '<span class="link-badge bidirectional">✓</span>'
+            link_state_badge = '<span class="link-badge bidirectional">✓</span>'
         elif len(outgoing) == 0 and incoming == 0:
-            status_badges += '<span class="link-badge unidirectional">⚠️</span>'
-        
-        # Generate link list
-        link_items = []
-        for target in sorted(outgoing):
-            target_layer = self.document_metadata.get(target, {}).get('layer', 'unknown')
-            if doc_name in self.link_graph.get(target, set()):
-                arrow = '↔'
-            else:
-                arrow = '→'
-            link_items.append(f'''
-                <div class="link-item">
-                    <span class="link-arrow">{arrow}</span>
-                    <span class="link-target">{target}</span>
-                    <span class="link-type-badge">{target_layer}</span>
-                </div>''')
+            link_state_badge = '<span class="link-badge unidirectional">⚠️</span>'
+        else:
+            link_state_badge = ''
         
-        # Add incoming-only links
-        for source, targets in self.link_graph.items():
-            if doc_name in targets and source not in outgoing:
-                source_layer = self.document_metadata.get(source, {}).get('layer', 'unknown')
-                link_items.append(f'''
-                <div class="link-item">
-                    <span class="link-arrow">←</span>
-                    <span class="link-target">{source}</span>
-                    <span class="link-type-badge">{source_layer}</span>
-                </div>''')
-        
-        link_list = ''.join(link_items) if link_items else '<p style="color: #6c757d; font-style: italic;">No established links</p>'
-        
-        return f'''
-        <div class="document-card">
-            <div class="document-header">
-                <h3 class="document-name">{doc_name}</h3>
-                <div class="link-status">
-                    {status_badges}
-                </div>
-            </div>
-            <div class="link-details">
-                <div class="link-list">
-                    {link_list}
-                </div>
-            </div>
-        </div>'''
+        return DOCUMENT_CARD_TEMPLATE % {
+            'name': doc_name.translate(HTML_ESCAPE_TABLE),
+            'incoming': incoming,
+            'outgoing': len(outgoing),
+            'link_state_badge': link_state_badge,
+            'link_list': self.generate_link_list(doc_name, outgoing),
+        }
     
     def generate_verification_summary(self, stats: Dict) -> str:
         """Generate a summary section for verification results."""
@@ -472,15 +936,12 @@ class EnhancedDashboardGenerator:
             
             passed = failed = pending = 0
             for ver_name, ver_data in verifications:
-                if 'test_results' in ver_data:
-                    test_results = ver_data['test_results']
-                    if 'summary' in test_results:
-                        scenarios = test_results['summary'].get('scenarios', {})
-                        if scenarios.get('failed', 0) > 0:
-                            failed += 1
-                        else:
-                            passed += 1
-                else:
+                status = self.verification_status.get(ver_name)
+                if status == 'failed':
+                    failed += 1
+                elif status in ('passed', 'empty'):
+                    passed += 1
+                elif status == 'pending':
                     pending += 1
             
             color = self.CATEGORY_COLORS.get(category, '#6c757d')
@@ -488,7 +949,7 @@ class EnhancedDashboardGenerator:
             category_cards.append(f'''
             <div class="category-summary-card">
                 <div class="category-header" style="border-left: 4px solid {color};">
-                    <h4>{category.capitalize()}</h4>
+                    <h4>{category.capitalize().translate(HTML_ESCAPE_TABLE)}</h4>
                     <span class="category-count">{len(verifications)} tests</span>
                 </div>
                 <div class="category-stats">
@@ -511,259 +972,152 @@ class EnhancedDashboardGenerator:
     
     def generate_dashboard(self) -> str:
         """Generate the complete HTML dashboard with verification results."""
+        return ''.join(self.iter_dashboard())
+    
+    def iter_dashboard(self) -> Iterator[str]:
+        """
+        Yield the HTML dashboard as a sequence of fragments.
+        
+        Nav items and cards are yielded as they are generated, so neither
+        they nor the full page are ever joined into one large string.
+        """
         stats = self.calculate_stats()
         
-        # Generate layer sections
-        layer_sections = []
+        # The page shell is split into parts; substitute() ignores the fields a
+        # part doesn't use. The stats dict is passed straight through for the
+        # $total_* fields, with these page fields layered over it.
+        page_fields = dict(
+            project_dir_name=self.project_dir.name.translate(HTML_ESCAPE_TABLE),
+            project_dir=str(self.project_dir).translate(HTML_ESCAPE_TABLE),
+            # Second precision is plenty for a generation stamp
+            timestamp=datetime.now().isoformat(timespec='seconds'),
+            stylesheet_href=STYLESHEET_HREF
+        )
+        
+        yield DASHBOARD_HEAD_TEMPLATE.substitute(stats, **page_fields)
+        
+        # Navigation items
+        if self.verification_results:
+            yield f'''
+            <a href="#verification-summary" class="nav-item">
+                <span class="nav-icon">📈</span>
+                <span class="nav-text">Test Results</span>
+                <span class="nav-count">{stats['total_verifications']}</span>
+            </a>'''
+        
+        yield ''.join(
+            NAV_ITEM_TEMPLATE % {
+                'layer': layer,
+                'icon': self.LAYER_NAV_ICONS.get(layer, '📄'),
+                'label': layer.capitalize(),
+                'count': len(docs),
+            }
+            for layer in self.HIERARCHY
+            for docs in (self.all_documents.get(layer, EMPTY_SET),)
+            if docs
+        )
+        
+        yield DASHBOARD_OVERVIEW_TEMPLATE.substitute(stats, **page_fields)
+        
+        # Verification summary first, if we have results
+        yield self.generate_verification_summary(stats)
+        
+        # Then one section per layer
         for layer in self.HIERARCHY:
-            if layer not in self.all_documents or not self.all_documents[layer]:
+            layer_docs = self.sorted_documents.get(layer)
+            if not layer_docs:
                 continue
                 
-            colors = self.LAYER_COLORS[layer]
             layer_title = layer.capitalize()
+            badge_class = self.LAYER_BADGE_CLASSES.get(layer, '')
             
-            # Generate document cards for this layer
-            cards = []
-            for doc_name in sorted(self.all_documents[layer]):
-                cards.append(self.generate_document_card(doc_name, layer, stats))
-            
-            section = f'''
+            yield f'''
             <section id="{layer}" class="layer-section">
                 <div class="layer-header">
                     <h2 class="layer-title">{layer_title}</h2>
-                    <span class="layer-badge badge-{layer}">{len(self.all_documents[layer])} Documents</span>
+                    <span class="layer-badge {badge_class}">{len(layer_docs)} Documents</span>
                 </div>
                 <div class="documents-grid">
-                    {''.join(cards)}
+                    '''
+            
+            # Generate document cards for this layer
+            for doc_name in layer_docs:
+                yield self.generate_document_card(doc_name, layer, stats)
+            
+            yield '''
                 </div>
             </section>'''
-            
-            layer_sections.append(section)
-        
-        # Add verification summary if we have results
-        verification_summary = self.generate_verification_summary(stats)
-        if verification_summary:
-            layer_sections.insert(0, verification_summary)
-        
-        # Generate navigation items
-        nav_items = []
-        
-        if self.verification_results:
-            nav_items.append(f'''
-            <a href="#verification-summary" class="nav-item">
-                <span class="nav-icon">📈</span>
-                <span class="nav-text">Test Results</span>
-                <span class="nav-count">{stats['total_verifications']}</span>
-            </a>''')
-        
-        for layer in self.HIERARCHY:
-            count = len(self.all_documents[layer])
-            if count > 0:
-                icon = {'domains': '🏛️', 'principles': '📐', 'rules': '📋', 'verification': '✓'}.get(layer, '📄')
-                nav_items.append(f'''
-                <a href="#{layer}" class="nav-item {layer}">
-                    <span class="nav-icon">{icon}</span>
-                    <span class="nav-text">{layer.capitalize()}</span>
-                    <span class="nav-count">{count}</span>
-                </a>''')
-        
-        # Enhanced CSS with verification-specific styles
-        enhanced_css = '''
-        .verification-card { border-top: 3px solid #dc3545; }
-        .verification-info { padding: 1rem 0; border-bottom: 1px solid #e9ecef; }
-        .verification-meta { display: flex; gap: 0.5rem; margin-bottom: 0.5rem; }
-        .category-tag { padding: 0.25rem 0.5rem; border-radius: 4px; font-size: 0.75rem; font-weight: 600; text-transform: uppercase; }
-        .display-type { color: #6c757d; font-size: 0.85rem; }
-        .verification-badge { padding: 0.25rem 0.5rem; border-radius: 12px; font-size: 0.75rem; font-weight: 600; }
-        .verification-badge.passed { background-color: #d4edda; color: #155724; }
-        .verification-badge.failed { background-color: #f8d7da; color: #721c24; }
-        .verification-badge.pending { background-color: #fff3cd; color: #856404; }
-        .verification-badge.chart { background-color: #d1ecf1; color: #0c5460; }
-        .verification-badge.unknown { background-color: #e9ecef; color: #6c757d; }
-        .result-links { display: flex; gap: 0.5rem; margin-top: 0.5rem; }
-        .result-link { padding: 0.2rem 0.5rem; background: #f8f9fa; border-radius: 4px; text-decoration: none; color: #495057; font-size: 0.85rem; }
-        .result-link:hover { background: #e9ecef; }
-        .category-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 1rem; margin-bottom: 2rem; }
-        .category-summary-card { background: white; border-radius: 8px; padding: 1.5rem; border: 1px solid #e9ecef; }
-        .category-header { display: flex; justify-content: space-between; align-items: center; margin-bottom: 1rem; padding-left: 1rem; }
-        .category-header h4 { margin: 0; font-size: 1.1rem; }
-        .category-count { background: #f8f9fa; padding: 0.2rem 0.5rem; border-radius: 12px; font-size: 0.75rem; }
-        .category-stats { display: flex; gap: 1rem; }
-        .stat-item { padding: 0.25rem 0.5rem; border-radius: 4px; font-size: 0.85rem; }
-        .stat-item.passed { background: #d4edda; color: #155724; }
-        .stat-item.failed { background: #f8d7da; color: #721c24; }
-        .stat-item.pending { background: #fff3cd; color: #856404; }
-        '''
         
-        html_template = '''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Architecture Documentation Dashboard - Enhanced</title>
-    <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{ font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; background-color: #f8f9fa; color: #333; line-height: 1.6; }}
-        .container {{ display: flex; min-height: 100vh; }}
-        .header {{ background: linear-gradient(135deg, #5a6fd8 0%, #4a5cc5 100%); color: white; padding: 1rem 2rem; position: fixed; top: 0; left: 280px; right: 0; z-index: 100; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }}
-        .header h1 {{ font-size: 1.5rem; font-weight: 600; }}
-        .header .subtitle {{ font-size: 0.9rem; opacity: 0.9; margin-top: 0.25rem; }}
-        .sidebar {{ width: 280px; background: white; border-right: 1px solid #e9ecef; position: fixed; top: 0; left: 0; height: 100vh; overflow-y: auto; z-index: 200; }}
-        .sidebar-header {{ padding: 1.5rem; border-bottom: 1px solid #e9ecef; background-color: #f8f9fa; }}
-        .sidebar-header h3 {{ color: #495057; font-size: 1.1rem; font-weight: 600; }}
-        .sidebar-nav {{ padding: 1rem 0; }}
-        .nav-item {{ display: flex; align-items: center; padding: 0.75rem 1.5rem; color: #495057; text-decoration: none; transition: all 0.2s ease; border-left: 3px solid transparent; cursor: pointer; }}
-        .nav-item:hover {{ background-color: #f8f9fa; color: #5a6fd8; }}
-        .nav-item.active {{ background-color: #e3f2fd; color: #5a6fd8; border-left-color: #5a6fd8; }}
-        .nav-icon {{ font-size: 1.2rem; margin-right: 0.75rem; width: 24px; text-align: center; }}
-        .nav-text {{ font-weight: 500; font-size: 0.9rem; }}
-        .nav-count {{ margin-left: auto; background-color: #e9ecef; color: #495057; padding: 0.2rem 0.5rem; border-radius: 12px; font-size: 0.75rem; font-weight: 600; }}
-        .main-content {{ flex: 1; margin-left: 280px; margin-top: 80px; padding: 2rem; }}
-        .layer-section {{ background: white; border-radius: 8px; padding: 2rem; margin-bottom: 2rem; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }}
-        .layer-header {{ display: flex; align-items: center; gap: 1rem; margin-bottom: 1.5rem; }}
-        .layer-title {{ font-size: 1.75rem; font-weight: 600; color: #2c3e50; }}
-        .layer-badge {{ padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.75rem; font-weight: 600; text-transform: uppercase; }}
-        .badge-domains {{ background-color: #cce5ff; color: #004085; }}
-        .badge-principles {{ background-color: #d4edda; color: #155724; }}
-        .badge-rules {{ background-color: #fff3cd; color: #856404; }}
-        .badge-verification {{ background-color: #f8d7da; color: #721c24; }}
-        .documents-grid {{ display: grid; grid-template-columns: repeat(auto-fill, minmax(320px, 1fr)); gap: 1.5rem; }}
-        .document-card {{ background: #fff; border: 1px solid #e9ecef; border-radius: 8px; padding: 1.5rem; transition: all 0.2s ease; }}
-        .document-card:hover {{ box-shadow: 0 4px 12px rgba(0,0,0,0.1); transform: translateY(-2px); }}
-        .document-header {{ display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 1rem; }}
-        .document-name {{ font-size: 1.1rem; font-weight: 600; color: #2c3e50; margin: 0; }}
-        .link-status {{ display: flex; gap: 0.5rem; }}
-        .link-badge {{ display: flex; align-items: center; gap: 0.25rem; padding: 0.2rem 0.5rem; border-radius: 12px; font-size: 0.75rem; font-weight: 600; }}
-        .link-badge.incoming {{ background-color: #e3f2fd; color: #1976d2; }}
-        .link-badge.outgoing {{ background-color: #f3e5f5; color: #7b1fa2; }}
-        .link-badge.bidirectional {{ background-color: #e8f5e9; color: #388e3c; }}
-        .link-badge.unidirectional {{ background-color: #fff3e0; color: #f57c00; }}
-        .link-details {{ margin-top: 1rem; padding-top: 1rem; border-top: 1px solid #e9ecef; }}
-        .link-list {{ font-size: 0.85rem; color: #6c757d; }}
-        .link-item {{ display: flex; align-items: center; gap: 0.5rem; margin-bottom: 0.5rem; padding: 0.25rem 0; }}
-        .link-arrow {{ font-size: 0.75rem; color: #adb5bd; }}
-        .link-target {{ color: #5a6fd8; text-decoration: none; flex: 1; }}
-        .link-type-badge {{ font-size: 0.65rem; padding: 0.1rem 0.3rem; border-radius: 4px; background-color: #f8f9fa; color: #6c757d; }}
-        .stats-container {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 1rem; margin-bottom: 2rem; }}
-        .stat-card {{ background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 1.5rem; border-radius: 8px; text-align: center; }}
-        .stat-value {{ font-size: 2rem; font-weight: 700; margin-bottom: 0.5rem; }}
-        .stat-label {{ font-size: 0.9rem; opacity: 0.9; }}
-        .footer {{ margin-top: 3rem; padding: 1.5rem; text-align: center; color: #6c757d; background: white; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }}
-        {enhanced_css}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <aside class="sidebar">
-            <div class="sidebar-header">
-                <h3>Architecture Layers</h3>
-            </div>
-            <nav class="sidebar-nav">
-                <a href="#overview" class="nav-item active">
-                    <span class="nav-icon">📊</span>
-                    <span class="nav-text">Overview</span>
-                </a>
-                {nav_items}
-            </nav>
-        </aside>
-
-        <main class="main-content">
-            <header class="header">
-                <h1>Architecture Documentation Dashboard</h1>
-                <div class="subtitle">Links & Verification Results from {project_dir_name}</div>
-            </header>
-
-            <section id="overview" class="layer-section">
-                <div class="stats-container">
-                    <div class="stat-card">
-                        <div class="stat-value">{total_documents}</div>
-                        <div class="stat-label">Total Documents</div>
-                    </div>
-                    <div class="stat-card" style="background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);">
-                        <div class="stat-value">{total_links}</div>
-                        <div class="stat-label">Total Links</div>
-                    </div>
-                    <div class="stat-card" style="background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%);">
-                        <div class="stat-value">{total_verifications}</div>
-                        <div class="stat-label">Verifications Run</div>
-                    </div>
-                    <div class="stat-card" style="background: linear-gradient(135deg, #43e97b 0%, #38f9d7 100%);">
-                        <div class="stat-value">{passed_verifications}/{total_verifications}</div>
-                        <div class="stat-label">Tests Passing</div>
-                    </div>
-                </div>
-            </section>
-
-            {layer_sections}
-
-            <div class="footer">
-                <p>Enhanced Architecture Dashboard with Verification Results</p>
-                <p>Generated: {timestamp}</p>
-                <p>Source: {project_dir}</p>
-            </div>
-        </main>
-    </div>
-
-    <script>
-        document.addEventListener('DOMContentLoaded', function() {{
-            const navItems = document.querySelectorAll('.nav-item');
-            const sections = document.querySelectorAll('section[id]');
-
-            navItems.forEach(item => {{
-                item.addEventListener('click', function(e) {{
-                    e.preventDefault();
-                    navItems.forEach(nav => nav.classList.remove('active'));
-                    this.classList.add('active');
-                    
-                    const targetId = this.getAttribute('href')?.substring(1);
-                    if (targetId) {{
-                        const targetSection = document.getElementById(targetId);
-                        if (targetSection) {{
-                            targetSection.scrollIntoView({{ behavior: 'smooth' }});
-                        }}
-                    }}
-                }});
-            }});
-        }});
-    </script>
-</body>
-</html>'''
-        
-        return html_template.format(
-            nav_items=''.join(nav_items),
-            layer_sections=''.join(layer_sections),
-            total_documents=stats['total_documents'],
-            total_links=stats['total_links'],
-            total_verifications=stats['total_verifications'],
-            passed_verifications=stats['passed_verifications'],
-            project_dir_name=self.project_dir.name,
-            project_dir=self.project_dir,
-            timestamp=datetime.now().isoformat(),
-            enhanced_css=enhanced_css
-        )
+        yield DASHBOARD_TAIL_TEMPLATE.substitute(stats, **page_fields)
     
     def save_dashboard(self) -> None:
         """Save the generated dashboard to file."""
-        html_content = self.generate_dashboard()
+        # Ensure the output and stylesheet directories exist
+        self.stylesheet_file.parent.mkdir(parents=True, exist_ok=True)
         
-        # Ensure output directory exists
-        self.output_file.parent.mkdir(parents=True, exist_ok=True)
+        # The stylesheet only changes with this script, so most runs skip
+        # rewriting it; it is still touched so is_up_to_date() sees it as
+        # fresh as the page it was generated with
+        if not write_if_changed(self.stylesheet_file, STYLESHEET.encode('utf-8')):
+            os.utime(self.stylesheet_file)
         
-        with open(self.output_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        # Fragments are encoded once each and go straight to a binary file,
+        # skipping the text layer; the large buffer turns the many small card
+        # writes into a few big ones
+        with open(self.output_file, 'wb', buffering=1 << 20) as f:
+            for fragment in self.iter_dashboard():
+                f.write(fragment.encode('utf-8'))
         
         print(f"Enhanced dashboard generated successfully: {self.output_file}")
     
-    def run(self) -> int:
-        """Main execution method."""
+    def iter_input_mtimes(self) -> Iterator[float]:
+        """Yield the modification times of every file and directory the loaders read."""
+        # Directory mtimes are included so a deleted input also counts as a change
+        for layer in self.HIERARCHY:
+            layer_dir = self.project_dir / layer
+            try:
+                yield layer_dir.stat().st_mtime
+            except FileNotFoundError:
+                continue
+            for entry in scan_files(layer_dir, '.md'):
+                yield entry.stat().st_mtime
+            for entry in scan_files(layer_dir, 'links.yaml'):
+                yield entry.stat().st_mtime
+        
+        categories_dir = self.project_dir / 'dashboard' / 'categories'
+        try:
+            yield categories_dir.stat().st_mtime
+        except FileNotFoundError:
+            return
+        for category_dir in scan_files(categories_dir, ''):
+            if category_dir.is_dir():
+                yield category_dir.stat().st_mtime
+                for entry in scan_files(category_dir.path, ''):
+                    yield entry.stat().st_mtime
+    
+    def is_up_to_date(self, *outputs: Path) -> bool:
+        """Check whether every output exists and is newer than all of the inputs."""
+        try:
+            oldest_output = min(output.stat().st_mtime for output in outputs)
+        except FileNotFoundError:
+            return False
+        return max(self.iter_input_mtimes(), default=0.0) <= oldest_output
+    
+    def run(self, debug: bool = False) -> int:
+        """Main execution method; debug (or DASHBOARD_DEBUG) prints the traceback of a failure."""
         try:
             print(f"Loading links from: {self.project_dir}")
-            self.load_all_links()
-            
             print(f"Loading verification results from: {self.project_dir / 'dashboard' / 'categories'}")
-            self.load_verification_results()
             
-            if not any(self.all_documents.values()):
+            # The two loaders read disjoint files into disjoint attributes, so
+            # their I/O can overlap; result() re-raises either one's error
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                links_loaded = executor.submit(self.load_all_links)
+                results_loaded = executor.submit(self.load_verification_results)
+                links_loaded.result()
+                results_loaded.result()
+            
+            if self.total_documents == 0:
                 print("No documents found in any layer directories.")
                 return 1
             
@@ -775,8 +1129,8 @@ class EnhancedDashboardGenerator:
             
         except Exception as e:
             print(f"Error generating dashboard: {e}", file=sys.stderr)
-            import traceback
-            traceback.print_exc()
+            if debug or os.environ.get('DASHBOARD_DEBUG'):
+                traceback.print_exc()
             return 1
 
 
@@ -800,6 +1154,16 @@ def main():
         action='store_true',
         help='Also output complete data as JSON'
     )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Regenerate even if the outputs are newer than every input'
+    )
+    parser.add_argument(
+        '--debug',
+        action='store_true',
+        help='Print a traceback when generation fails (or set DASHBOARD_DEBUG)'
+    )
     
     args = parser.parse_args()
     
@@ -810,8 +1174,19 @@ def main():
     
     output_file = Path(args.output) if args.output else project_dir / 'dashboard' / 'enhanced-dashboard.html'
     
+    json_file = output_file.with_suffix('.json')
+    
     generator = EnhancedDashboardGenerator(project_dir, output_file)
-    exit_code = generator.run()
+    
+    # Skip the whole load and render when nothing has changed since the last run
+    outputs = (output_file, generator.stylesheet_file)
+    if args.json:
+        outputs += (json_file,)
+    if not args.force and generator.is_up_to_date(*outputs):
+        print(f"Dashboard is up to date: {output_file}")
+        return 0
+    
+    exit_code = generator.run(debug=args.debug)
     
     if args.json and exit_code == 0:
         # Export all data as JSON
@@ -825,9 +1200,7 @@ def main():
             'document_metadata': generator.document_metadata
         }
         
-        json_file = output_file.with_suffix('.json')
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(json_output, f, indent=2, default=str)
+        dump_json_file(json_file, json_output)
         print(f"JSON data saved to: {json_file}")
     
     return exit_code
@@ -12,6 +12,16 @@ import shutil
 import subprocess
 import json
 import argparse
+import atexit
+import functools
+import hashlib
+import queue
+import shlex
+import signal
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from gherkin.parser import Parser
 
@@ -22,6 +32,26 @@ except ImportError:
     print("ERROR: markdown-it-py is not installed. Please run: pip install markdown-it-py", file=sys.stderr)
     sys.exit(2)
 
+# orjson is optional; when present it serializes the results JSON
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Title Case spellings used by normalize_gherkin_keywords, keyed by upper case.
+# Section keywords end in a colon; step keywords must be followed by whitespace.
+SECTION_KEYWORDS = {
+    'FEATURE:': 'Feature:',
+    'BACKGROUND:': 'Background:',
+    'SCENARIO:': 'Scenario:',
+}
+STEP_KEYWORDS = {
+    'GIVEN': 'Given',
+    'WHEN': 'When',
+    'THEN': 'Then',
+    'AND': 'And',
+    'BUT': 'But',
+}
 
 class Colors:
     """ANSI color codes for terminal output"""
@@ -54,18 +84,35 @@ def normalize_gherkin_keywords(text):
     if text is None:
         return ""
     
-    # Use re.IGNORECASE and re.MULTILINE for robust, case-insensitive matching
-    # at the start of each line.
-    text = re.sub(r"^\s*FEATURE:", "Feature:", text, flags=re.IGNORECASE | re.MULTILINE)
-    text = re.sub(r"^\s*BACKGROUND:", "Background:", text, flags=re.IGNORECASE | re.MULTILINE)
-    text = re.sub(r"^\s*SCENARIO:", "Scenario:", text, flags=re.IGNORECASE | re.MULTILINE)
-    text = re.sub(r"^\s*GIVEN\s", "Given ", text, flags=re.IGNORECASE | re.MULTILINE)
-    text = re.sub(r"^\s*WHEN\s", "When ", text, flags=re.IGNORECASE | re.MULTILINE)
-    text = re.sub(r"^\s*THEN\s", "Then ", text, flags=re.IGNORECASE | re.MULTILINE)
-    text = re.sub(r"^\s*AND\s", "And ", text, flags=re.IGNORECASE | re.MULTILINE)
-    text = re.sub(r"^\s*BUT\s", "But ", text, flags=re.IGNORECASE | re.MULTILINE)
+    # One pass over the lines: each line's leading word is looked up in the
+    # keyword tables, and only that word is rewritten
+    lines = text.split('\n')
+    for i, line in enumerate(lines):
+        stripped = line.lstrip()
+        if not stripped:
+            continue
+        indent = line[:len(line) - len(stripped)]
+        
+        word = stripped.split(None, 1)[0]
+        keyword = STEP_KEYWORDS.get(word.upper()) if len(word) < len(stripped) else None
+        if keyword is None:
+            word = stripped[:stripped.find(':') + 1]
+            keyword = SECTION_KEYWORDS.get(word.upper())
+        
+        if keyword is None:
+            continue
+        if keyword in STEP_KEYWORDS.values():
+            # The whitespace after a step keyword becomes a plain space, which
+            # is the only separator the parser accepts
+            lines[i] = indent + keyword + ' ' + stripped[len(word) + 1:]
+        else:
+            lines[i] = indent + keyword + stripped[len(word):]
     
-    return text
+    return '\n'.join(lines)
+
+
+# A line ending (CRLF, CR or LF) together with any trailing whitespace before it
+LINE_END_PATTERN = re.compile(r'[^\S\r\n]*(?:\r\n?|\n)')
 
 
 def clean_script_content(script_content):
@@ -75,32 +122,47 @@ def clean_script_content(script_content):
     if not script_content:
         return ""
     
-    cleaned = normalize_line_endings(script_content)
-    lines = cleaned.split('\n')
+    # One pass normalizes line endings to LF and removes trailing whitespace
+    # from every line but the last, which has no line ending to match
+    cleaned = LINE_END_PATTERN.sub('\n', script_content)
+    if cleaned[-1].isspace():
+        head, sep, last_line = cleaned.rpartition('\n')
+        cleaned = head + sep + last_line.rstrip()
 
     # Strip shebang if present, as the runner calls bash explicitly
-    if lines and lines[0].strip().startswith("#!"):
-        lines.pop(0)
-    
-    # Remove trailing whitespace from each line while preserving structure
-    cleaned_lines = [line.rstrip() for line in lines]
+    first_line, sep, rest = cleaned.partition('\n')
+    if first_line.strip().startswith("#!"):
+        cleaned = rest
     
-    return '\n'.join(cleaned_lines)
+    return cleaned
+
+
+# Whether the standard streams are terminals that get colors, checked once at startup
+STDOUT_TTY = sys.stdout.isatty()
+STDERR_TTY = sys.stderr.isatty()
 
 
 def print_colored(text, color='', end='\n', file=sys.stdout):
     """Print text with color if supported to the specified file stream."""
-    # Check if we're in a terminal that supports colors for the given file stream
-    if hasattr(file, 'isatty') and file.isatty():
-        print(f"{color}{text}{Colors.RESET}", end=end, file=file)
+    if file is sys.stdout:
+        tty = STDOUT_TTY
+    elif file is sys.stderr:
+        tty = STDERR_TTY
+    else:
+        tty = hasattr(file, 'isatty') and file.isatty()
+    
+    if tty and color:
+        file.write(f"{color}{text}{Colors.RESET}{end}")
     else:
-        print(text, end=end, file=file)
+        file.write(f"{text}{end}")
 
 
+@functools.lru_cache(maxsize=1)
 def find_bash_executable():
     """
     Find a suitable bash executable, prioritizing native Windows shells (like Git Bash)
     over WSL to ensure consistent behavior and environment.
+    The result is cached, so the search runs once per process.
     """
     # On non-Windows systems, 'bash' in the PATH is almost always the right choice.
     if sys.platform != "win32":
@@ -147,9 +209,217 @@ def find_bash_executable():
     sys.exit(1)
 
 
+# Snapshot of the process environment as a plain dict, which is much cheaper
+# to copy per step than os.environ
+BASE_ENV = dict(os.environ)
+
+
+# Runs by `bash -c` in a BashSession, formatted with the quoted paths of the
+# session's files: each line read from stdin runs the step script once. The
+# script is eval'd in a subshell, so an exit, cd or variable change stays
+# inside its step. The paths are inlined rather than held in variables so
+# the step sees no driver state, and `: "$0"` leaves $_ as it is under
+# `bash -c`. It must stay a single line, so that eval numbers the script's
+# lines from 1 and diagnostics read "bash: line N: ..." exactly as they do
+# under `bash -c script`.
+BASH_SESSION_DRIVER = (
+    'while read -r _; do '
+    '(. {env}; : "$0"; eval "$(<{script})") '
+    '</dev/null >{stdout} 2>{stderr}; '
+    "printf '%d\\n' $?; "
+    'done'
+)
+
+
+class BashSession:
+    """
+    A long-lived bash process that runs step scripts without starting bash per step.
+
+    The step's variables and script go to files in the session's temporary
+    directory, and BASH_SESSION_DRIVER runs them with stdin from /dev/null
+    and stdout/stderr connected to FIFOs there, which are read like
+    subprocess.run's pipes. Only the exit status comes back over the
+    session's stdout pipe. A step sees and prints the same as under
+    `bash -c`, except that $$ is the session shell's PID, the same for
+    every step, and a syntax error is reported as "bash: eval: line N"
+    rather than "bash: -c: line N".
+    """
+
+    def __init__(self, bash_executable):
+        self.temp_dir = tempfile.TemporaryDirectory(prefix='gherkin-runner-')
+        temp_path = Path(self.temp_dir.name)
+        self.env_path = temp_path / 'step.env'
+        self.script_path = temp_path / 'step.sh'
+        self.stdout_path = temp_path / 'step.stdout'
+        self.stderr_path = temp_path / 'step.stderr'
+        # FIFOs rather than files, so a script that reopens /dev/stdout or
+        # /dev/stderr (e.g. `tee /dev/stderr`) writes to a pipe as it would
+        # under subprocess.run, instead of truncating a file
+        os.mkfifo(self.stdout_path)
+        os.mkfifo(self.stderr_path)
+
+        # A new session (process group) lets a timeout kill any step
+        # processes along with the shell
+        driver = BASH_SESSION_DRIVER.format(
+            env=shlex.quote(self.env_path.as_posix()),
+            script=shlex.quote(self.script_path.as_posix()),
+            stdout=shlex.quote(self.stdout_path.as_posix()),
+            stderr=shlex.quote(self.stderr_path.as_posix())
+        )
+        self.process = subprocess.Popen(
+            # $0 is the executable, as it is under `bash -c`
+            [bash_executable, '--noprofile', '--norc', '-c', driver, bash_executable],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding='utf-8',
+            env=BASE_ENV,
+            start_new_session=(sys.platform != 'win32')
+        )
+
+        # Statuses are read on a thread so a step can be timed out portably
+        self.statuses = queue.Queue()
+        threading.Thread(target=self.read_statuses, daemon=True).start()
+
+    def read_statuses(self):
+        """Forward each status line from the shell to the queue; None marks its exit."""
+        for line in self.process.stdout:
+            self.statuses.put(line)
+        self.statuses.put(None)
+
+    def is_alive(self):
+        return self.process.poll() is None
+
+    @staticmethod
+    def read_output(path, outputs):
+        """Read a FIFO to EOF into outputs[path]; opening it waits for the step to open its end."""
+        try:
+            # Text mode applies the same newline translation as subprocess.run(text=True)
+            with open(path, 'r', encoding='utf-8') as f:
+                outputs[path] = f.read()
+        except Exception as e:
+            outputs[path] = e
+
+    def run(self, script, variables, timeout):
+        """
+        Run a script with the given variables exported, returning a CompletedProcess.
+
+        Raises subprocess.TimeoutExpired after closing the session if the script
+        runs too long, and RuntimeError if the shell exits mid-step.
+        """
+        with open(self.env_path, 'w', encoding='utf-8', newline='\n') as f:
+            f.writelines(
+                f"export {key}={shlex.quote(str(value))}\n" for key, value in variables.items()
+            )
+        with open(self.script_path, 'w', encoding='utf-8', newline='\n') as f:
+            f.write(script)
+
+        # Both outputs are drained at once, so a step filling one can't stall
+        outputs = {}
+        readers = [
+            threading.Thread(target=self.read_output, args=(path, outputs), daemon=True)
+            for path in (self.stdout_path, self.stderr_path)
+        ]
+        for reader in readers:
+            reader.start()
+
+        # Any line starts the next step
+        deadline = time.monotonic() + timeout
+        self.process.stdin.write('\n')
+        self.process.stdin.flush()
+
+        try:
+            status = self.statuses.get(timeout=timeout)
+        except queue.Empty:
+            self.close()
+            raise subprocess.TimeoutExpired(script, timeout)
+        if status is None:
+            self.close()
+            raise RuntimeError('bash session exited unexpectedly')
+
+        # As with subprocess.run, the output ends at EOF, once any background
+        # process the step started has closed it too
+        for reader in readers:
+            reader.join(max(0.0, deadline - time.monotonic()))
+            if reader.is_alive():
+                self.close()
+                raise subprocess.TimeoutExpired(script, timeout)
+        for output in outputs.values():
+            if isinstance(output, Exception):
+                raise output
+
+        return subprocess.CompletedProcess(
+            args=self.process.args, returncode=int(status),
+            stdout=outputs[self.stdout_path], stderr=outputs[self.stderr_path]
+        )
+
+    def close(self):
+        """Stop the shell and any step still running, and remove the temporary files."""
+        if self.is_alive():
+            try:
+                if sys.platform != 'win32':
+                    os.killpg(self.process.pid, signal.SIGKILL)
+                else:
+                    self.process.kill()
+            except OSError:
+                pass
+        try:
+            self.process.stdin.close()
+        except OSError:
+            pass
+        self.process.wait()
+
+        # A reader still waiting to open a FIFO the shell never opened gets
+        # EOF rather than blocking forever
+        for path in (self.stdout_path, self.stderr_path):
+            try:
+                os.close(os.open(path, os.O_WRONLY | os.O_NONBLOCK))
+            except OSError:
+                pass
+        self.temp_dir.cleanup()
+
+
+# One session per bash executable and thread, since a session runs one step
+# at a time; started on first use and closed at exit
+BASH_SESSIONS = {}
+BASH_SESSIONS_LOCK = threading.Lock()
+
+
+def get_bash_session(bash_executable):
+    """
+    Return a running BashSession for the executable on this thread, starting
+    one if needed. Returns None if the session can't be started.
+    """
+    # The session's output FIFOs need os.mkfifo, which Windows lacks
+    if not hasattr(os, 'mkfifo'):
+        return None
+
+    key = (bash_executable, threading.get_ident())
+    session = BASH_SESSIONS.get(key)
+    if session is None or not session.is_alive():
+        try:
+            session = BashSession(bash_executable)
+        except OSError:
+            return None
+        with BASH_SESSIONS_LOCK:
+            BASH_SESSIONS[key] = session
+    return session
+
+
+@atexit.register
+def close_bash_sessions():
+    with BASH_SESSIONS_LOCK:
+        for session in BASH_SESSIONS.values():
+            session.close()
+        BASH_SESSIONS.clear()
+
+
 def execute_shell_script(script_content, variables=None, context=None, debug=False, timeout=60):
     """
     Execute a shell script, passing variables via the environment for robustness.
+    Scripts run in a shared BashSession, falling back to a one-shot
+    bash process if the session can't be started.
     """
     if variables is None:
         variables = {}
@@ -166,13 +436,7 @@ def execute_shell_script(script_content, variables=None, context=None, debug=Fal
     bash_executable = find_bash_executable()
     
     try:
-        script_env = os.environ.copy()
         all_vars = {**context, **variables}
-        
-        for key, value in all_vars.items():
-            script_env[key] = str(value)
-
-        command = [bash_executable, '-c', cleaned_script]
 
         if debug:
             print("--- DEBUG: Variables passed to script (as environment) ---")
@@ -182,14 +446,22 @@ def execute_shell_script(script_content, variables=None, context=None, debug=Fal
             print(cleaned_script)
             print("------------------------------------------")
 
-        result = subprocess.run(
-            command,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            encoding='utf-8',
-            env=script_env
-        )
+        session = get_bash_session(bash_executable)
+        if session is not None:
+            result = session.run(cleaned_script, all_vars, timeout)
+        else:
+            script_env = {**BASE_ENV, **{key: str(value) for key, value in all_vars.items()}}
+            # stdin is closed to match the session, so a script can't block on
+            # or inherit the terminal
+            result = subprocess.run(
+                [bash_executable, '-c', cleaned_script],
+                stdin=subprocess.DEVNULL,
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+                encoding='utf-8',
+                env=script_env
+            )
             
         if debug:
             print(f"--- DEBUG: Result (Exit Code: {result.returncode}) ---")
@@ -217,48 +489,97 @@ def execute_shell_script(script_content, variables=None, context=None, debug=Fal
         )
 
 
-def load_implementation_file(file_path, debug=False):
+# Parsed implementation files are cached per user, keyed on the source's
+# mtime and size. Bump the version whenever the parsing rules change.
+IMPLEMENTATION_CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'gherkin-runner' / 'impls'
+IMPLEMENTATION_CACHE_VERSION = 2
+
+# An IMPLEMENTS header line: the step pattern is the rest of the line, without
+# surrounding whitespace ([^\S\n] is whitespace other than a newline)
+IMPLEMENTS_PATTERN = re.compile(r'^[^\S\n]*IMPLEMENTS[^\S\n]+(\S.*?)[^\S\n]*$', re.MULTILINE)
+
+
+def implementation_cache_path(file_path):
+    """Return the cache file for an implementation file, named by a hash of its absolute path."""
+    digest = hashlib.sha1(str(Path(file_path).resolve()).encode('utf-8')).hexdigest()
+    return IMPLEMENTATION_CACHE_DIR / f"{digest}.json"
+
+
+def load_cached_implementations(file_path, st):
+    """Return the cached implementations for a file if its stat still matches, else None."""
+    try:
+        with open(implementation_cache_path(file_path), 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if (cached.get('version') == IMPLEMENTATION_CACHE_VERSION
+                and cached.get('mtime_ns') == st.st_mtime_ns
+                and cached.get('size') == st.st_size):
+            return cached['impls']
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+    return None
+
+
+def save_cached_implementations(file_path, st, implementations):
+    """Write the parsed implementations to the cache; failures just mean a re-parse next time."""
+    cache_path = implementation_cache_path(file_path)
+    payload = {
+        'version': IMPLEMENTATION_CACHE_VERSION,
+        'mtime_ns': st.st_mtime_ns,
+        'size': st.st_size,
+        'impls': implementations
+    }
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump(payload, f)
+    except OSError:
+        pass
+
+
+def load_implementation_file(file_path, debug=False, use_cache=True):
     """
     Load implementation file with automatic line ending normalization.
+    Unless use_cache is False, a cached parse is reused while the file is unchanged.
     """
     implementations = {}
     
     try:
+        st = os.stat(file_path)
+        if use_cache:
+            cached = load_cached_implementations(file_path, st)
+            if cached is not None:
+                if debug:
+                    print(f"Loaded {len(cached)} cached implementations for: {file_path}")
+                return cached
+        
+        # newline=None (universal newlines) already turns CRLF and CR into LF
         with open(file_path, 'r', encoding='utf-8', newline=None) as f:
             content = f.read()
         
-        content = normalize_line_endings(content)
-        
         if debug:
             print(f"Loading implementations from: {file_path}")
         
-        implements_pattern = r'^IMPLEMENTS\s+(.+?)$'
-        lines = content.split('\n')
-        
-        current_step = None
-        current_script = []
-        
-        for line in lines:
-            implements_match = re.match(implements_pattern, line.strip())
+        # Each script is the text between its header line and the next one.
+        # A header with no lines at all after it has no script and is skipped.
+        headers = list(IMPLEMENTS_PATTERN.finditer(content))
+        for i, header in enumerate(headers):
+            body_start = header.end() + 1
+            if i + 1 < len(headers):
+                # Stop before the newline that ends the last script line
+                body_end = headers[i + 1].start() - 1
+            else:
+                body_end = len(content)
             
-            if implements_match:
-                if current_step and current_script:
-                    script_content = '\n'.join(current_script)
-                    implementations[current_step] = clean_script_content(script_content)
-                
-                current_step = implements_match.group(1).strip()
-                current_script = []
-            elif current_step is not None:
-                current_script.append(line)
-        
-        if current_step and current_script:
-            script_content = '\n'.join(current_script)
-            implementations[current_step] = clean_script_content(script_content)
+            if body_start <= body_end:
+                implementations[header.group(1)] = clean_script_content(content[body_start:body_end])
         
         if debug:
             print(f"Found {len(implementations)} implementations")
             for step_pattern in implementations.keys():
                 print(f"  - {step_pattern}")
+        
+        if use_cache:
+            save_cached_implementations(file_path, st, implementations)
             
     except Exception as e:
         print(f"Error loading implementation file {file_path}: {str(e)}")
@@ -287,70 +608,414 @@ def find_implementation_files(impl_dir, debug=False):
     return [str(f) for f in gherkin_files]
 
 
-def load_all_implementations(impl_files, debug=False):
+def load_all_implementations(impl_files, debug=False, use_cache=True):
     """
-    Load all implementation files and combine them into a single dictionary.
+    Load all implementation files and combine them into a single dictionary
+    mapping each step pattern to its compiled regex and script.
     """
     all_implementations = {}
     
     print(f"Loading implementations from {len(impl_files)} file(s)...")
     
     for impl_file in impl_files:
-        implementations = load_implementation_file(impl_file, debug)
+        implementations = load_implementation_file(impl_file, debug, use_cache)
         
         for step_pattern, script in implementations.items():
             if step_pattern in all_implementations:
                 print(f"{Colors.YELLOW}Warning: Duplicate implementation for step: {step_pattern}{Colors.RESET}")
-            all_implementations[step_pattern] = script
+            
+            # Compile each pattern once here so run_step only has to match;
+            # an invalid pattern is reported once and dropped
+            try:
+                compiled_pattern = re.compile(f"^{step_pattern}$", re.IGNORECASE)
+            except re.error as e:
+                print(f"{Colors.YELLOW}Warning: Invalid regex pattern '{step_pattern}': {e}{Colors.RESET}")
+                all_implementations.pop(step_pattern, None)
+                continue
+            all_implementations[step_pattern] = (compiled_pattern, script)
     
     print(f"Found {len(all_implementations)} step implementations.")
     return all_implementations
 
 
+# Numbered or named backreferences would point at the wrong groups once a
+# pattern is embedded in the combined alternation
+BACKREFERENCE_PATTERN = re.compile(r'\\\d|\(\?P=')
+
+REGEX_METACHARACTERS = frozenset('.^$*+?{}[]\\|()')
+
+
+def literal_prefix(step_pattern):
+    """
+    Return the lower-cased literal text that every match of a step pattern starts with.
+
+    This is conservative: it stops at the first regex metacharacter or non-ASCII
+    character, drops a character that a following quantifier makes optional,
+    and returns '' for any pattern containing an alternation.
+    """
+    if '|' in step_pattern:
+        return ''
+    
+    end = 0
+    while end < len(step_pattern):
+        char = step_pattern[end]
+        if char in REGEX_METACHARACTERS or not char.isascii():
+            if char in '*?{' and end > 0:
+                end -= 1
+            break
+        end += 1
+    return step_pattern[:end].lower()
+
+
+def required_literal(step_pattern):
+    """
+    Return the longest lower-cased literal run that every match of a step pattern contains.
+
+    Only text outside groups and character classes counts. As with
+    literal_prefix, escapes and non-ASCII characters end a run, a character
+    that a following quantifier makes optional is dropped, and any pattern
+    containing an alternation gets ''.
+    """
+    if '|' in step_pattern:
+        return ''
+    
+    longest = ''
+    current = ''
+    depth = 0
+    in_class = False
+    in_braces = False
+    escaped = False
+    for i, char in enumerate(step_pattern):
+        if escaped:
+            escaped = False
+        elif in_class:
+            if char == '\\':
+                escaped = True
+            # A ']' straight after the opening '[' or '[^' is a literal member
+            elif char == ']' and step_pattern[i - 1] != '[' and step_pattern[i - 2:i] != '[^':
+                in_class = False
+        elif in_braces:
+            in_braces = char != '}'
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif depth == 0 and char not in REGEX_METACHARACTERS and char.isascii():
+            current += char
+            continue
+        else:
+            # Any other metacharacter ends the run
+            if char in '*?{':
+                current = current[:-1]
+            escaped = char == '\\'
+            in_class = char == '['
+            in_braces = char == '{'
+        
+        if len(current) > len(longest):
+            longest = current
+        current = ''
+    if len(current) > len(longest):
+        longest = current
+    return longest.lower()
+
+
+class StepDispatcher:
+    """
+    Matches step text against the implementation patterns in one regex pass.
+
+    Patterns are indexed by their literal prefix, and a pattern is skipped when
+    the step lacks the literal text all its matches contain, so only the ones
+    that could match a step are tried. Those candidates are joined into a single
+    alternation in implementation order (compiled once per candidate set), so
+    the first pattern that matches still wins. If the patterns can't be
+    combined, because one uses backreferences or they repeat a group name, it
+    falls back to trying each candidate's compiled pattern in turn.
+    """
+
+    def __init__(self, implementations):
+        self.implementations = implementations
+        self.entries = list(implementations.values())
+        self.all_positions = tuple(range(len(self.entries)))
+        self.combinable = not any(BACKREFERENCE_PATTERN.search(p) for p in implementations)
+        
+        # Lower-cased literal prefix -> positions of the patterns starting with it
+        self.prefix_index = {}
+        for position, step_pattern in enumerate(implementations):
+            self.prefix_index.setdefault(literal_prefix(step_pattern), []).append(position)
+        self.prefix_lengths = sorted({len(prefix) for prefix in self.prefix_index})
+        
+        # Lower-cased literal text each pattern's matches must contain ('' if
+        # none is known); in verbose mode whitespace in a pattern isn't literal
+        self.required_literals = [
+            '' if compiled_pattern.flags & re.VERBOSE else required_literal(step_pattern)
+            for step_pattern, (compiled_pattern, _) in implementations.items()
+        ]
+        
+        # Candidate positions -> (combined regex or None, outer group -> alternative)
+        self.alternations = {}
+
+    def __len__(self):
+        return len(self.implementations)
+
+    def candidates(self, text):
+        """
+        Return, in implementation order, the positions of the patterns whose
+        prefix the text starts with and whose required literal it contains.
+        """
+        head = text[:self.prefix_lengths[-1]] if self.prefix_lengths else ''
+        # Case-insensitive matching can pair non-ASCII characters with ASCII
+        # ones (e.g. the Kelvin sign with 'k'), so those texts skip the index
+        if not head.isascii():
+            return self.all_positions
+        
+        head = head.lower()
+        positions = []
+        for length in self.prefix_lengths:
+            if length > len(head):
+                break
+            positions.extend(self.prefix_index.get(head[:length], ()))
+        
+        # A substring test is far cheaper than a failed regex match
+        lowered = text.lower()
+        return tuple(sorted(position for position in positions if self.required_literals[position] in lowered))
+
+    def alternation(self, positions):
+        """Return the combined regex and group map for a candidate set, compiling it on first use."""
+        cached = self.alternations.get(positions)
+        if cached is not None:
+            return cached
+        
+        combined = None
+        # Outer group number of each alternative -> (position, capture count, script)
+        alternatives = {}
+        if self.combinable:
+            parts = []
+            group_number = 1
+            for position in positions:
+                compiled_pattern, script = self.entries[position]
+                parts.append(f"(^{compiled_pattern.pattern[1:-1]}$)")
+                alternatives[group_number] = (position, compiled_pattern.groups, script)
+                group_number += 1 + compiled_pattern.groups
+            try:
+                combined = re.compile("|".join(parts), re.IGNORECASE)
+            except re.error:
+                combined = None
+        
+        cached = self.alternations[positions] = (combined, alternatives)
+        return cached
+
+    def match_text(self, text):
+        """Return (position, capture groups, script) for the first pattern matching the text, or None."""
+        positions = self.candidates(text)
+        if not positions:
+            return None
+        
+        combined, alternatives = self.alternation(positions)
+        if combined is None:
+            for position in positions:
+                compiled_pattern, script = self.entries[position]
+                match = compiled_pattern.match(text)
+                if match:
+                    return position, match.groups(), script
+            return None
+        
+        match = combined.match(text)
+        if not match:
+            return None
+        position, group_count, script = alternatives[match.lastindex]
+        first_group = match.lastindex
+        return position, match.groups()[first_group:first_group + group_count], script
+
+    def match(self, step_text, full_step_text):
+        """
+        Find the first implementation matching the step text, with or without its keyword.
+
+        Returns a (capture groups, script) tuple, or None if nothing matches.
+        """
+        # Patterns take precedence in order, whichever text they match, so the
+        # earlier of the two texts' winning patterns is used
+        best = None
+        for text in (step_text, full_step_text):
+            found = self.match_text(text)
+            if found and (best is None or found[0] < best[0]):
+                best = found
+        
+        if best is None:
+            return None
+        return best[1], best[2]
+
+
 def run_step(step_text, step_keyword, implementations, context=None, debug=False):
     """
-    Run a single step by finding a matching implementation.
+    Run a single step by finding a matching implementation in a StepDispatcher.
     """
     full_step_text = f"{step_keyword} {step_text}".strip()
     
-    for pattern, script_content in implementations.items():
-        try:
-            match = re.match(f"^{pattern}$", step_text, re.IGNORECASE)
-            
-            if not match:
-                match = re.match(f"^{pattern}$", full_step_text, re.IGNORECASE)
+    found = implementations.match(step_text, full_step_text)
+    if found:
+        groups, script_content = found
+        variables = {}
+        for i, group in enumerate(groups, 1):
+            variables[f'MATCH_{i}'] = group if group is not None else ""
+        
+        result = execute_shell_script(script_content, variables, context, debug)
+        
+        return {
+            'status': 'passed' if result.returncode == 0 else 'failed',
+            'output': result.stderr if result.returncode != 0 and result.stderr.strip() else None,
+            'stdout': result.stdout if result.stdout else None,
+            'stderr': result.stderr if result.stderr else None,
+            'exit_code': result.returncode
+        }
 
-            if match:
-                variables = {}
-                for i, group in enumerate(match.groups(), 1):
-                    variables[f'MATCH_{i}'] = group if group is not None else ""
-                
-                result = execute_shell_script(script_content, variables, context, debug)
-                
-                return {
-                    'status': 'passed' if result.returncode == 0 else 'failed',
-                    'output': result.stderr if result.returncode != 0 and result.stderr.strip() else None,
-                    'stdout': result.stdout if result.stdout else None,
-                    'stderr': result.stderr if result.stderr else None,
-                    'exit_code': result.returncode
-                }
-                
-        except re.error as e:
-            if debug:
-                print(f"Invalid regex pattern '{pattern}': {e}")
+    return {'status': 'undefined', 'output': f'No implementation found for: {full_step_text}'}
+
+
+# Fenced code block opener as CommonMark defines it: up to three spaces of
+# indentation, three or more backticks or tildes, then the info string
+FENCE_OPEN_PATTERN = re.compile(r'^( {0,3})(`{3,}|~{3,})(.*)$')
+
+# A **Category**: line starting a paragraph, list item, heading or quote
+CATEGORY_LINE_PATTERN = re.compile(
+    r'^[ \t]*(?:>[ \t]*)*(?:[-*+][ \t]+|\d{1,9}[.)][ \t]+|#{1,6}[ \t]+)?\*\*Category\*\*:\s*(\w+)',
+    re.IGNORECASE
+)
+LIST_OR_HEADING_PATTERN = re.compile(r'^[ \t]*(?:>[ \t]*)*(?:[-*+][ \t]|\d{1,9}[.)][ \t]|#{1,6}[ \t])')
+LIST_ITEM_PATTERN = re.compile(r'^[ \t]*(?:>[ \t]*)*(?:[-*+]|\d{1,9}[.)])(?:[ \t]|$)')
+
+# One-line blocks: an ATX heading or a thematic break ends before the next
+# line, which starts a new block
+ATX_HEADING_PATTERN = re.compile(r'^ {0,3}(?:>[ \t]*)*#{1,6}(?:[ \t]|$)')
+THEMATIC_BREAK_PATTERN = re.compile(r'^ {0,3}([-*_])(?:[ \t]*\1){2,}[ \t]*$')
+# A setext underline turns the paragraph above it into a heading
+SETEXT_UNDERLINE_PATTERN = re.compile(r'^ {0,3}(?:=+|-+)[ \t]*$')
+
+
+def scan_markdown(content):
+    """
+    Find the last gherkin fenced block and the last Category bullet with a line scan.
+
+    This matches markdown-it for top-level fences and metadata lines without
+    building a token stream: a Category line only counts where a block can
+    start (after a blank line, heading, thematic break or setext underline,
+    or as a list item or heading) and not inside an indented code block.
+    Fences nested in list items or block quotes are not modelled;
+    parse_markdown (--strict) is the exact fallback.
+    """
+    gherkin_content = None
+    category = None
+    
+    lines = content.split('\n')
+    if content.endswith('\n'):
+        lines.pop()
+    
+    # previous_blank: the line starts a new block; paragraph: the previous
+    # line was top-level paragraph text
+    previous_blank = True
+    paragraph = False
+    in_list = False
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        
+        fence = FENCE_OPEN_PATTERN.match(line)
+        if fence and not (fence.group(2)[0] == '`' and '`' in fence.group(3)):
+            indent = len(fence.group(1))
+            marker = fence.group(2)
+            body = []
+            i += 1
+            # The block runs to a closing fence of the same character that is
+            # at least as long, or to the end of the document
+            while i < len(lines):
+                closing = lines[i].strip()
+                if (closing and len(lines[i]) - len(lines[i].lstrip(' ')) <= 3
+                        and closing.startswith(marker) and closing == marker[0] * len(closing)):
+                    break
+                # Content loses up to the opening fence's indentation
+                body_line = lines[i]
+                body.append(body_line[min(indent, len(body_line) - len(body_line.lstrip(' '))):])
+                i += 1
+            
+            # markdown-it keeps the info string unstripped, so it must be exact
+            if fence.group(3) == 'gherkin':
+                gherkin_content = ''.join(body_line + '\n' for body_line in body)
+            previous_blank = True
+            paragraph = False
+            i += 1
             continue
+        
+        i += 1
+        if not line.strip():
+            previous_blank = True
+            paragraph = False
+            continue
+        
+        # A line indented four or more columns that can't continue a paragraph
+        # or list item is (or continues) an indented code block, which ends
+        # at the next less indented line
+        expanded = line.expandtabs(4)
+        indent = len(expanded) - len(expanded.lstrip(' '))
+        if indent >= 4 and not in_list and previous_blank:
+            previous_blank = True
+            paragraph = False
+            continue
+        
+        # Only a line that starts a block can begin the Category inline text
+        if previous_blank or LIST_OR_HEADING_PATTERN.match(line):
+            match = CATEGORY_LINE_PATTERN.match(line)
+            if match:
+                category = match.group(1).lower()
+        
+        if THEMATIC_BREAK_PATTERN.match(line) or ATX_HEADING_PATTERN.match(line):
+            previous_blank = True
+            paragraph = False
+        elif paragraph and SETEXT_UNDERLINE_PATTERN.match(line):
+            previous_blank = True
+            paragraph = False
+        elif LIST_ITEM_PATTERN.match(line):
+            in_list = True
+            previous_blank = False
+            paragraph = False
+        else:
+            # An unindented line after a blank one ends any list
+            if previous_blank and indent == 0:
+                in_list = False
+            previous_blank = False
+            paragraph = not in_list
     
-    return {'status': 'undefined', 'output': f'No implementation found for: {full_step_text}'}
+    return gherkin_content, category
 
 
-def extract_from_markdown(markdown_file):
+def parse_markdown(content):
     """
-    Parses a Markdown file to extract the Gherkin feature block and the Category metadata.
+    Find the last gherkin fenced block and the last Category bullet with a full markdown-it parse.
     """
     gherkin_content = None
     category = None
-    md_parser = MarkdownIt()
     
+    tokens = MarkdownIt().parse(content)
+    
+    for token in tokens:
+        # Extract Gherkin content from a fenced code block
+        if token.type == 'fence' and token.info == 'gherkin':
+            gherkin_content = token.content
+        
+        # Extract Category from the metadata bullet list
+        if (token.type == 'inline' and 
+            token.content.strip().lower().startswith('**category**:')):
+            
+            match = re.search(r'^\*\*Category\*\*:\s*(\w+)', token.content.strip(), re.IGNORECASE)
+            if match:
+                category = match.group(1).lower()
+    
+    return gherkin_content, category
+
+
+def extract_from_markdown(markdown_file, strict=False):
+    """
+    Parses a Markdown file to extract the Gherkin feature block and the Category metadata.
+    A line scan is used unless strict is set, which parses with markdown-it.
+    """
     try:
         markdown_path = Path(markdown_file)
         if not markdown_path.is_file():
@@ -358,22 +1023,7 @@ def extract_from_markdown(markdown_file):
         with open(markdown_path, 'r', encoding='utf-8') as f:
             content = f.read()
         
-        tokens = md_parser.parse(content)
-        
-        for i, token in enumerate(tokens):
-            # Extract Gherkin content from a fenced code block
-            if token.type == 'fence' and token.info == 'gherkin':
-                gherkin_content = token.content
-            
-            # Extract Category from the metadata bullet list
-            if (token.type == 'inline' and 
-                token.content.strip().lower().startswith('**category**:')):
-                
-                match = re.search(r'^\*\*Category\*\*:\s*(\w+)', token.content.strip(), re.IGNORECASE)
-                if match:
-                    category = match.group(1).lower()
-
-        return gherkin_content, category
+        return parse_markdown(content) if strict else scan_markdown(content)
     except FileNotFoundError:
         print_colored(f"Error: Markdown file not found at {markdown_file}", Colors.RED, file=sys.stderr)
         return None, None
@@ -382,12 +1032,122 @@ def extract_from_markdown(markdown_file):
         return None, None
 
 
-def run_markdown_file(markdown_file, implementations, output_dir, debug=False, json_output=False):
+def scenario_base_context(markdown_file, output_dir, category):
+    """
+    Build the context variables every scenario of a markdown file starts with,
+    creating the category output directory the steps write into.
+    """
+    base_context = {}
+    
+    # --- MODIFIED: Add VFILENAME to context ---
+    base_context['VFILENAME'] = Path(markdown_file).stem
+    # --- END MODIFICATION ---
+
+    # Calculate and inject the category output directory into the context
+    if category:
+        output_category_dir = Path(output_dir) / 'categories' / category
+        # Ensure the directory exists *before* steps run
+        output_category_dir.mkdir(parents=True, exist_ok=True)
+        # Pass the absolute, resolved path to the script
+        base_context['CATEGORY_DIR'] = str(output_category_dir.resolve())
+    else:
+        # Fallback to the base output dir if no category is found
+        base_dir = Path(output_dir).resolve()
+        base_dir.mkdir(parents=True, exist_ok=True)
+        base_context['CATEGORY_DIR'] = str(base_dir)
+    
+    return base_context
+
+
+def run_scenario(scenario, implementations, base_context, debug=False, json_output=False, emit=print_colored):
+    """
+    Run one scenario's steps in order, skipping the rest once a step fails.
+    The scenario's context starts as a copy of base_context.
+    Progress lines go through emit, which takes print_colored's arguments.
+    Returns the scenario result and its per-status step counts.
+    """
+    scenario_result = {'name': scenario['name'], 'status': 'passed', 'steps': []}
+    step_counts = {'total': 0, 'passed': 0, 'failed': 0, 'skipped': 0, 'undefined': 0}
+    
+    if not json_output:
+        emit(f"\n  Scenario: {scenario['name']}")
+    
+    scenario_failed = False
+    scenario_context = dict(base_context)
+    
+    is_first_step = True 
+
+    for step in scenario.get('steps', []):
+        step_counts['total'] += 1
+        step_keyword = step['keyword'].strip()
+        step_text = step['text']
+        
+        if scenario_failed:
+            step_result = {'keyword': step_keyword, 'text': step_text, 'status': 'skipped'}
+            step_counts['skipped'] += 1
+            if not json_output:
+                emit(f"    - {step_keyword} {step_text}", Colors.YELLOW)
+        else:
+            step_result = run_step(step_text, step_keyword, implementations, scenario_context, debug)
+            step_result['keyword'] = step_keyword
+            step_result['text'] = step_text
+            
+            if step_result['status'] == 'passed':
+                step_counts['passed'] += 1
+                if step_result.get('stdout') is not None:
+                    # This is the key change to preserve the initial context
+                    if is_first_step: 
+                        scenario_context['GIVEN_STDOUT'] = step_result['stdout'].strip()
+                        is_first_step = False 
+                    
+                    # Always update the previous step's output for simple chaining
+                    scenario_context['PREVIOUS_STEP_STDOUT'] = step_result['stdout'].strip()
+
+                if not json_output:
+                    emit(f"    V {step_keyword} {step_text}", Colors.GREEN)
+            else:
+                scenario_failed = True
+                scenario_result['status'] = 'failed'
+                if step_result['status'] == 'failed':
+                    step_counts['failed'] += 1
+                    if not json_output:
+                        emit(f"    ? {step_keyword} {step_text}", Colors.RED)
+                        if step_result.get('stderr'):
+                            emit(f"      Error: {step_result['stderr']}", Colors.RED, file=sys.stderr)
+                elif step_result['status'] == 'undefined':
+                    step_counts['undefined'] += 1
+                    if not json_output:
+                        emit(f"    ? {step_keyword} {step_text}", Colors.MAGENTA)
+                        if step_result.get('output'):
+                            emit(f"      {step_result['output']}", Colors.MAGENTA, file=sys.stderr)
+        
+        scenario_result['steps'].append(step_result)
+    
+    return scenario_result, step_counts
+
+
+def add_scenario_result(results, scenario_result, step_counts):
+    """Append a finished scenario to the feature results and add it to the summary."""
+    summary = results['summary']
+    summary['scenarios']['total'] += 1
+    if scenario_result['status'] == 'passed':
+        summary['scenarios']['passed'] += 1
+    else:
+        summary['scenarios']['failed'] += 1
+    
+    for status, count in step_counts.items():
+        summary['steps'][status] += count
+    
+    results['scenarios'].append(scenario_result)
+
+
+def run_markdown_file(markdown_file, implementations, output_dir, debug=False, json_output=False, jobs=1, strict=False):
     """
     Extracts Gherkin from a markdown file and runs it using the provided implementations.
+    With jobs > 1, scenarios run concurrently on that many threads.
     Returns the results and the extracted category.
     """
-    feature_content, category = extract_from_markdown(markdown_file)
+    feature_content, category = extract_from_markdown(markdown_file, strict)
 
     if not feature_content:
         error_msg = f"No Gherkin content found in {markdown_file}"
@@ -420,89 +1180,32 @@ def run_markdown_file(markdown_file, implementations, output_dir, debug=False, j
         if not json_output:
             print_colored(f"Feature: {feature['name']}", Colors.BOLD)
         
-        for child in feature.get('children', []):
-            if 'scenario' in child:
-                scenario = child['scenario']
-                scenario_result = {'name': scenario['name'], 'status': 'passed', 'steps': []}
-                results['summary']['scenarios']['total'] += 1
-                
-                if not json_output:
-                    print_colored(f"\n  Scenario: {scenario['name']}")
-                
-                scenario_failed = False
-                scenario_context = {}
-                
-                # --- MODIFIED: Add VFILENAME to context ---
-                scenario_context['VFILENAME'] = Path(markdown_file).stem
-                # --- END MODIFICATION ---
-
-                # Calculate and inject the category output directory into the context
-                if category:
-                    output_category_dir = Path(output_dir) / 'categories' / category
-                    # Ensure the directory exists *before* steps run
-                    output_category_dir.mkdir(parents=True, exist_ok=True)
-                    # Pass the absolute, resolved path to the script
-                    scenario_context['CATEGORY_DIR'] = str(output_category_dir.resolve())
-                else:
-                    # Fallback to the base output dir if no category is found
-                    base_dir = Path(output_dir).resolve()
-                    base_dir.mkdir(parents=True, exist_ok=True)
-                    scenario_context['CATEGORY_DIR'] = str(base_dir)
-                
-                is_first_step = True 
-
-                for step in scenario.get('steps', []):
-                    results['summary']['steps']['total'] += 1
-                    step_keyword = step['keyword'].strip()
-                    step_text = step['text']
-                    
-                    if scenario_failed:
-                        step_result = {'keyword': step_keyword, 'text': step_text, 'status': 'skipped'}
-                        results['summary']['steps']['skipped'] += 1
-                        if not json_output:
-                            print_colored(f"    - {step_keyword} {step_text}", Colors.YELLOW)
-                    else:
-                        step_result = run_step(step_text, step_keyword, implementations, scenario_context, debug)
-                        step_result['keyword'] = step_keyword
-                        step_result['text'] = step_text
-                        
-                        if step_result['status'] == 'passed':
-                            results['summary']['steps']['passed'] += 1
-                            if step_result.get('stdout') is not None:
-                                # This is the key change to preserve the initial context
-                                if is_first_step: 
-                                    scenario_context['GIVEN_STDOUT'] = step_result['stdout'].strip()
-                                    is_first_step = False 
-                                
-                                # Always update the previous step's output for simple chaining
-                                scenario_context['PREVIOUS_STEP_STDOUT'] = step_result['stdout'].strip()
-
-                            if not json_output:
-                                print_colored(f"    V {step_keyword} {step_text}", Colors.GREEN)
-                        else:
-                            scenario_failed = True
-                            scenario_result['status'] = 'failed'
-                            if step_result['status'] == 'failed':
-                                results['summary']['steps']['failed'] += 1
-                                if not json_output:
-                                    print_colored(f"    ? {step_keyword} {step_text}", Colors.RED)
-                                    if step_result.get('stderr'):
-                                        print_colored(f"      Error: {step_result['stderr']}", Colors.RED, file=sys.stderr)
-                            elif step_result['status'] == 'undefined':
-                                results['summary']['steps']['undefined'] += 1
-                                if not json_output:
-                                    print_colored(f"    ? {step_keyword} {step_text}", Colors.MAGENTA)
-                                    if step_result.get('output'):
-                                        print_colored(f"      {step_result['output']}", Colors.MAGENTA, file=sys.stderr)
-                    
-                    scenario_result['steps'].append(step_result)
-                
-                if scenario_result['status'] == 'passed':
-                    results['summary']['scenarios']['passed'] += 1
-                else:
-                    results['summary']['scenarios']['failed'] += 1
-                
-                results['scenarios'].append(scenario_result)
+        scenarios = [child['scenario'] for child in feature.get('children', []) if 'scenario' in child]
+        # The file name and output directory are the same for every scenario
+        base_context = scenario_base_context(markdown_file, output_dir, category) if scenarios else {}
+        
+        if jobs > 1 and len(scenarios) > 1:
+            # Each scenario's output is buffered and replayed in order, so
+            # concurrent scenarios don't interleave their step lines
+            def run_buffered(scenario):
+                lines = []
+                outcome = run_scenario(
+                    scenario, implementations, base_context, debug, json_output,
+                    emit=lambda *args, **kwargs: lines.append((args, kwargs))
+                )
+                return outcome, lines
+            
+            with ThreadPoolExecutor(max_workers=min(jobs, len(scenarios))) as executor:
+                for (scenario_result, step_counts), lines in executor.map(run_buffered, scenarios):
+                    for args, kwargs in lines:
+                        print_colored(*args, **kwargs)
+                    add_scenario_result(results, scenario_result, step_counts)
+        else:
+            for scenario in scenarios:
+                scenario_result, step_counts = run_scenario(
+                    scenario, implementations, base_context, debug, json_output
+                )
+                add_scenario_result(results, scenario_result, step_counts)
         
         return results, category
         
@@ -513,6 +1216,17 @@ def run_markdown_file(markdown_file, implementations, output_dir, debug=False, j
         return {'error': error_msg, 'summary': {}}, category
 
 
+def format_results_json(results):
+    """
+    Serialize results as UTF-8 JSON bytes indented by 2 spaces, using orjson
+    when it is installed. The json fallback also writes non-ASCII text as
+    UTF-8 rather than as \\uXXXX escapes, as orjson does.
+    """
+    if orjson is not None:
+        return orjson.dumps(results, option=orjson.OPT_INDENT_2)
+    return json.dumps(results, indent=2, ensure_ascii=False).encode('utf-8')
+
+
 def print_summary(results):
     """Print a summary of test results."""
     if 'summary' not in results:
@@ -562,6 +1276,13 @@ environment variables during execution:
     Capture groups from the step's 'IMPLEMENTS' regex pattern.
     (e.g., IMPLEMENTS an inventory for (.*) would put the matched
     text into $MATCH_1)
+
+Each step script runs in a subshell of one long-lived bash process per
+thread, rather than a new `bash -c` per step. Where that session can't
+be started (e.g. on Windows) every step falls back to `bash -c`. Under
+the session, $$ is the same for every step (the session shell's PID),
+and a syntax error is reported as "bash: eval: line N" instead of
+"bash: -c: line N".
 """
     # --- END OF UPDATED HELP TEXT ---
 
@@ -581,13 +1302,17 @@ environment variables during execution:
     parser.add_argument('--json', action='store_true', help='Output results as JSON to stdout')
     parser.add_argument('--debug', action='store_true', help='Enable debug output')
     parser.add_argument('--display', action='store_true', help='Display extracted Gherkin and category, then exit')
+    parser.add_argument('--strict', action='store_true', help='Parse the markdown with markdown-it instead of the faster line scan')
+    parser.add_argument('--no-cache', action='store_true', help='Parse implementation files without reading or writing the cache')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='Number of scenarios to run concurrently. Only use this when scenarios do not write to the same files. (default: 1)')
     parser.add_argument('implementation_files', nargs='*', help='Specific implementation files to use (overrides --impl-dir)')
     
     args = parser.parse_args()
     
     # Handle the new --display flag
     if args.display:
-        gherkin_content, category = extract_from_markdown(args.markdown_file)
+        gherkin_content, category = extract_from_markdown(args.markdown_file, args.strict)
         print_colored("--- Gherkin Display Mode ---", Colors.CYAN + Colors.BOLD)
         print(f"\nFile: {Path(args.markdown_file).name}")
         
@@ -611,13 +1336,16 @@ environment variables during execution:
         print_colored(f"No implementation files found in {args.impl_dir}", Colors.RED, file=sys.stderr)
         sys.exit(1)
     
-    implementations = load_all_implementations(impl_files, args.debug)
+    implementations = StepDispatcher(load_all_implementations(impl_files, args.debug, not args.no_cache))
     
     if not implementations:
         print_colored("No step implementations found", Colors.RED, file=sys.stderr)
         sys.exit(1)
     
-    results, category = run_markdown_file(args.markdown_file, implementations, args.output_dir, args.debug, args.json)
+    results, category = run_markdown_file(args.markdown_file, implementations, args.output_dir, args.debug, args.json, args.jobs, args.strict)
+    
+    # Serialized once for both the log file and --json
+    results_json = format_results_json(results)
     
     # Write log file to the specified directory structure
     if category:
@@ -629,8 +1357,8 @@ environment variables during execution:
             log_filename = markdown_path.with_suffix('.stdout').name
             output_log_path = output_category_dir / log_filename
             
-            with open(output_log_path, 'w', encoding='utf-8') as f:
-                json.dump(results, f, indent=2)
+            with open(output_log_path, 'wb') as f:
+                f.write(results_json)
             
             if not args.json:
                  print_colored(f"INFO: Results log written to {output_log_path}", Colors.BLUE)
@@ -641,8 +1369,12 @@ environment variables during execution:
         print_colored("Warning: 'Category' not found in metadata. Cannot write log file.", Colors.YELLOW, file=sys.stderr)
 
     # Print to standard output as requested
+    # The UTF-8 bytes go straight to the stdout buffer so a console with
+    # another encoding can't fail on non-ASCII output
     if args.json:
-        print(json.dumps(results, indent=2))
+        sys.stdout.flush()
+        sys.stdout.buffer.write(results_json + b'\n')
+        sys.stdout.flush()
     else:
         print_summary(results)
     
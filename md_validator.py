@@ -16,6 +16,8 @@ from dataclasses import dataclass, field
 from enum import Enum, Flag
 import logging
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     from markdown_it import MarkdownIt
@@ -25,6 +27,13 @@ except ImportError:
     sys.exit(2)
 
 
+# libyaml's C loader and dumper are far faster than the pure-Python ones;
+# fall back when PyYAML was built without them
+try:
+    from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(message)s')
 logger = logging.getLogger(__name__)
@@ -32,6 +41,29 @@ logger = logging.getLogger(__name__)
 # Defined regex as a constant for reusability and clarity
 RELATIVE_LINK_PATTERN = re.compile(r'\[(?:[^\]]+)\]\(([^)]+)\)')
 
+# Link targets with these prefixes point outside the project and are not validated
+EXTERNAL_LINK_PREFIXES = ('http://', 'https://', 'mailto:', '#')
+
+# The allowed_targets filename rule that --force writes for Markdown targets,
+# and that most links.yaml rules use, compiled once for all of them
+MARKDOWN_FILENAME_REGEX = r'.*\.md$'
+MARKDOWN_FILENAME_PATTERN = re.compile(MARKDOWN_FILENAME_REGEX)
+
+# YAML path -> (mtime_ns, size, parsed data), so a file is only parsed again once it changes
+_YAML_CACHE: Dict[Path, Tuple[int, int, Any]] = {}
+
+
+def _load_yaml_cached(path: Path) -> Any:
+    """Parse a YAML file, reusing the previous parse while the file is unchanged."""
+    st = path.stat()
+    cached = _YAML_CACHE.get(path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    with path.open('r', encoding='utf-8') as f:
+        data = yaml.load(f, Loader=YamlLoader)
+    _YAML_CACHE[path] = (st.st_mtime_ns, st.st_size, data)
+    return data
+
 
 class ErrorLevel(Enum):
     """Error severity levels for validation."""
@@ -65,12 +97,21 @@ class MarkdownValidator:
         self.md_parser = MarkdownIt()
         self.spec = None
         self.links_spec = None
+        # (source directory, rule directory) -> resolved target directory
+        self.target_dirs: Dict[Tuple[Path, str], Optional[Path]] = {}
+        # Worker threads in verify_project hold back their messages here
+        self.pending_logs = threading.local()
 
     def log(self, level: ErrorLevel, message: str):
         """Centralised logging with level prefixes."""
         if self.quiet and level != ErrorLevel.FATAL:
             return
 
+        pending = getattr(self.pending_logs, 'messages', None)
+        if pending is not None:
+            pending.append((level, message))
+            return
+
         prefix = f"[{level.value}]"
         if level == ErrorLevel.FATAL:
             logger.error(f"{prefix} {message}")
@@ -87,7 +128,7 @@ class MarkdownValidator:
             return None
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f)
+                return yaml.load(f, Loader=YamlLoader)
         except yaml.YAMLError as e:
             self.log(ErrorLevel.FATAL, f"Failed to parse {spec_name}: {e}")
             return None
@@ -114,20 +155,54 @@ class MarkdownValidator:
             if 'sequence' not in block:
                 self.log(ErrorLevel.WARN, "Block missing 'sequence' key in spec.yaml")
                 return False
+
+            # Compile content regexes once rather than for every token checked;
+            # an invalid one is left to fail, and be reported, per file as before
+            for step in block['sequence']:
+                if 'content_regex' in step:
+                    try:
+                        step['content_pattern'] = re.compile(step['content_regex'])
+                    except re.error:
+                        pass
         return True
 
     def load_links_spec(self, links_path: Path) -> bool:
         """Load and validate links.yaml file."""
         self.links_spec = self._load_yaml_file(links_path, "links.yaml")
-        return self.links_spec is not None
+        if self.links_spec is None:
+            return False
+
+        # Compile filename regexes once rather than for every link checked;
+        # an invalid one is left to fail, and be reported, per file as before
+        if isinstance(self.links_spec, dict):
+            for target in self.links_spec.get('allowed_targets') or []:
+                try:
+                    if target['filename_regex'] == MARKDOWN_FILENAME_REGEX:
+                        target['filename_pattern'] = MARKDOWN_FILENAME_PATTERN
+                    else:
+                        target['filename_pattern'] = re.compile(target['filename_regex'])
+                except (re.error, KeyError, TypeError):
+                    pass
+        return True
 
     def find_markdown_files(self, directory: Path) -> List[Path]:
         """Recursively find all Markdown files, excluding hidden directories."""
         md_files = []
-        for path in directory.rglob('*.md'):
-            if any(part.startswith('.') for part in path.parts):
+        # Hidden directories such as .git are pruned rather than walked and
+        # filtered afterwards; DirEntry types save a stat per entry
+        pending = [str(directory)]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        if entry.name.startswith('.'):
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.name.endswith('.md') and entry.is_file():
+                            md_files.append(Path(entry.path))
+            except OSError:
                 continue
-            md_files.append(path)
         return sorted(md_files)
 
     def _describe_step(self, step: Dict[str, Any]) -> str:
@@ -175,7 +250,7 @@ class MarkdownValidator:
             else:
                 content_to_check = token.content
 
-            pattern = re.compile(step['content_regex'])
+            pattern = step.get('content_pattern') or re.compile(step['content_regex'])
             if not pattern.fullmatch(content_to_check):
                 return False, 0, f"line {line_num}: Content does not fully match the expected pattern: {step['content_regex']}"
 
@@ -270,10 +345,34 @@ class MarkdownValidator:
             if token.type == 'link_open':
                 url = token.attrs.get('href', '')
                 line_num = token.map[0] + 1 if token.map else 0
-                if not url.startswith(('http://', 'https://', 'mailto:', '#')):
+                if not url.startswith(EXTERNAL_LINK_PREFIXES):
                     relative_links.append((url, line_num))
         return relative_links
 
+    def _resolve_target_dir(self, source_dir: Path, directory: str) -> Optional[Path]:
+        """Resolve an allowed_targets directory relative to a source directory, once per pair."""
+        key = (source_dir, directory)
+        if key not in self.target_dirs:
+            try:
+                self.target_dirs[key] = (source_dir / directory).resolve()
+            except FileNotFoundError:
+                self.target_dirs[key] = None
+        return self.target_dirs[key]
+
+    def _is_allowed_link(self, source_dir: Path, link: str) -> bool:
+        """Check a relative link from source_dir against the allowed_targets rules."""
+        link_path = source_dir / link
+        try:
+            link_dir = link_path.resolve().parent
+        except FileNotFoundError:
+            link_dir = None
+        for target in self.links_spec['allowed_targets']:
+            target_dir = self._resolve_target_dir(source_dir, target['directory'])
+            filename_pattern = target.get('filename_pattern') or re.compile(target['filename_regex'])
+            if link_dir is not None and link_dir == target_dir and filename_pattern.match(link_path.name):
+                return True
+        return False
+
     def validate_links(self, filepath: Path, tokens: List[Token], result: ValidationResult) -> bool:
         """Validate hyperlinks against links.yaml, now accepting tokens."""
         if not self.links_spec:
@@ -283,18 +382,12 @@ class MarkdownValidator:
         all_links = [link for link, _ in links_with_locations]
 
         if 'allowed_targets' in self.links_spec:
+            # A link repeated in the file is only resolved and checked once
+            link_validity: Dict[str, bool] = {}
             for link, line_num in links_with_locations:
-                link_path = filepath.parent / link
-                link_valid = False
-                for target in self.links_spec['allowed_targets']:
-                    target_dir = filepath.parent / target['directory']
-                    filename_pattern = re.compile(target['filename_regex'])
-                    try:
-                        if link_path.resolve().parent == target_dir.resolve() and filename_pattern.match(link_path.name):
-                            link_valid = True
-                            break
-                    except FileNotFoundError:
-                        continue
+                link_valid = link_validity.get(link)
+                if link_valid is None:
+                    link_valid = link_validity[link] = self._is_allowed_link(filepath.parent, link)
                 if not link_valid:
                     message = f"{filepath.name}: line {line_num}: Invalid link target '{link}'"
                     result.warnings.append(message)
@@ -331,6 +424,14 @@ class MarkdownValidator:
             self.log(ErrorLevel.FATAL, f"{filepath.name}: {e}")
         return result
 
+    def _validate_file_deferred(self, filepath: Path) -> Tuple[ValidationResult, List[Tuple[ErrorLevel, str]]]:
+        """Validate a file, returning its log messages instead of emitting them."""
+        self.pending_logs.messages = []
+        try:
+            return self.validate_file(filepath), self.pending_logs.messages
+        finally:
+            self.pending_logs.messages = None
+
     def verify_project(self, directory: Path) -> int:
         """
         Verify all Markdown files in the project.
@@ -347,21 +448,27 @@ class MarkdownValidator:
         files_with_errors = 0
         files_with_warnings = 0
 
-        for filepath in md_files:
-            result = self.validate_file(filepath)
-            status = "PASS"
-            if result.has_errors:
-                status = "FAIL"
-            elif result.has_warnings:
-                status = "WARN"
+        # Files are validated concurrently to overlap their reads; each file's
+        # messages are replayed in order so the report reads as before
+        with ThreadPoolExecutor() as executor:
+            outcomes = executor.map(self._validate_file_deferred, md_files)
+            for filepath, (result, messages) in zip(md_files, outcomes):
+                for level, message in messages:
+                    self.log(level, message)
+
+                status = "PASS"
+                if result.has_errors:
+                    status = "FAIL"
+                elif result.has_warnings:
+                    status = "WARN"
 
-            self.log(ErrorLevel.INFO,
-                    f"{status:<5} {filepath.name}: {len(result.errors)} errors, {len(result.warnings)} warnings")
+                self.log(ErrorLevel.INFO,
+                        f"{status:<5} {filepath.name}: {len(result.errors)} errors, {len(result.warnings)} warnings")
 
-            if result.has_errors:
-                files_with_errors += 1
-            if result.has_warnings:
-                files_with_warnings += 1
+                if result.has_errors:
+                    files_with_errors += 1
+                if result.has_warnings:
+                    files_with_warnings += 1
 
         self.log(ErrorLevel.INFO,
                 f"\nSummary: {len(md_files)} files validated, "
@@ -397,6 +504,18 @@ class LinkValidator:
         self.exit_code = LinkExitCode.OK
         self.results: List[LinkValidationDetail] = []
         self.summary = {"total": 0, "broken": 0, "unidirectional": 0, "disallowed": 0}
+        # Joined path -> resolved path; the checks resolve the same few
+        # directories and documents over and over
+        self.resolved_paths: Dict[Path, Path] = {}
+        # (target directory, target file) -> its established links in forward-slash form
+        self.back_links: Dict[Tuple[Path, str], Set[str]] = {}
+
+    def _resolve(self, path: Path) -> Path:
+        """Path.resolve(), remembered for the rest of the run."""
+        resolved = self.resolved_paths.get(path)
+        if resolved is None:
+            resolved = self.resolved_paths[path] = path.resolve()
+        return resolved
 
     def _log(self, message: str, level: str = "INFO"):
         if self.quiet and level != "ERROR":
@@ -414,8 +533,8 @@ class LinkValidator:
         if not path.exists():
             return None
         try:
-            with path.open('r', encoding='utf-8') as f:
-                return yaml.safe_load(f)
+            # Every link into a directory re-reads its links.yaml for the bidirectional check
+            return _load_yaml_cached(path)
         except Exception as e:
             logger.error(f"[ERROR] YAML parse error in {path}: {e}")
             self._add_exit_flag(LinkExitCode.SYSTEM_ERROR)
@@ -428,7 +547,7 @@ class LinkValidator:
         
         if 'allowed_targets' in root_links_yaml:
             for rule in root_links_yaml.get('allowed_targets', []):
-                rule_dir = (self.directory / rule['directory']).resolve()
+                rule_dir = self._resolve(self.directory / rule['directory'])
                 if rule_dir.is_dir():
                     dirs_to_scan.add(rule_dir)
 
@@ -439,10 +558,10 @@ class LinkValidator:
 
             for source_file, target_links in links_yaml.get('established_links', {}).items():
                 if not target_links: continue
-                source_abs = (current_dir / source_file).resolve()
+                source_abs = self._resolve(current_dir / source_file)
                 for target_link in target_links:
                     try:
-                        target_abs = (current_dir / target_link.replace('\\', '/')).resolve()
+                        target_abs = self._resolve(current_dir / target_link.replace('\\', '/'))
                         graph[source_abs].add(target_abs)
                     except Exception:
                         continue
@@ -581,12 +700,12 @@ class LinkValidator:
         """Check if a single link is allowed by the rules."""
         try:
             normalized_link = target_link.replace('\\', '/')
-            target_abs = (source_dir / normalized_link).resolve()
+            target_abs = self._resolve(source_dir / normalized_link)
         except Exception:
             return False
 
         for rule in rules:
-            rule_dir = (source_dir / rule['directory']).resolve()
+            rule_dir = self._resolve(source_dir / rule['directory'])
             if target_abs.parent == rule_dir:
                 if re.fullmatch(rule['filename_regex'], target_abs.name):
                     return True
@@ -595,16 +714,23 @@ class LinkValidator:
     def _check_bidirectional(self, target_link: str, source_file: str, source_dir: Path) -> Tuple[str, str]:
         """Check for a reverse link."""
         normalized_link = target_link.replace('\\', '/')
-        target_path = (source_dir / normalized_link).resolve()
+        target_path = self._resolve(source_dir / normalized_link)
         
         target_links_yaml = self._load_links_yaml(target_path.parent)
         if not target_links_yaml or 'established_links' not in target_links_yaml:
             return "INFO", "Target directory has no links.yaml or established_links"
 
-        source_path = (source_dir / source_file).resolve()
+        source_path = self._resolve(source_dir / source_file)
         relative_back_path = Path(os.path.relpath(source_path, target_path.parent)).as_posix()
         
-        established_in_target = [Path(p.replace('\\', '/')).as_posix() for p in target_links_yaml['established_links'].get(target_path.name, [])]
+        # Normalised once per target file rather than once per link pointing at it
+        key = (target_path.parent, target_path.name)
+        established_in_target = self.back_links.get(key)
+        if established_in_target is None:
+            established_in_target = self.back_links[key] = {
+                Path(p.replace('\\', '/')).as_posix()
+                for p in target_links_yaml['established_links'].get(target_path.name, [])
+            }
         
         if relative_back_path in established_in_target:
             return "PASS", "Bidirectional link confirmed"
@@ -625,10 +751,11 @@ class LinkDisplayer:
         self.start_directory = Path(args.directory).resolve()
         self.max_depth = getattr(args, 'max_depth', None) 
         
-        # Graph structure: source_file -> list of target files
-        self.graph: Dict[str, List[str]] = defaultdict(list)
-        # Reverse graph: target_file -> list of source files
-        self.reverse_graph: Dict[str, List[str]] = defaultdict(list)
+        # Graph structure: source_file -> target files, kept as an insertion-ordered
+        # dict so repeated links are dropped without rescanning a list
+        self.graph: Dict[str, Dict[str, None]] = defaultdict(dict)
+        # Reverse graph: target_file -> source files, ordered the same way
+        self.reverse_graph: Dict[str, Dict[str, None]] = defaultdict(dict)
         
         # Directory Dependency Graph: Source Dir -> Set of Target Dirs
         self.dir_links: Dict[Path, Set[Path]] = defaultdict(set)
@@ -636,6 +763,8 @@ class LinkDisplayer:
         self.visited_dirs: Set[Path] = set()
         self.discovered_files: Set[str] = set()
         self.file_to_dir: Dict[str, Path] = {}
+        # (source directory, link) -> resolved target, shared by every file in the directory
+        self.resolved_links: Dict[Tuple[Path, str], Optional[Tuple[Path, Path]]] = {}
 
     def _read_links_yaml(self, directory: Path) -> Optional[Dict]:
         """Reads links.yaml from a directory."""
@@ -644,7 +773,7 @@ class LinkDisplayer:
             return None
         try:
             with open(links_file, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=YamlLoader)
                 return data if data else {}
         except (yaml.YAMLError, IOError) as e:
             logger.warning(f"[WARN] Could not read {links_file}: {e}")
@@ -652,13 +781,19 @@ class LinkDisplayer:
 
     def _resolve_link_path(self, source_dir: Path, link: str) -> Optional[Tuple[Path, Path]]:
         """Resolves a relative link to absolute paths."""
+        key = (source_dir, link)
+        if key in self.resolved_links:
+            return self.resolved_links[key]
+
+        resolved = None
         try:
             target_path = (source_dir / link).resolve()
-            if not target_path.exists():
-                return None
-            return target_path, target_path.parent
+            if target_path.exists():
+                resolved = target_path, target_path.parent
         except Exception:
-            return None
+            pass
+        self.resolved_links[key] = resolved
+        return resolved
 
     def _normalize_path(self, file_path: Path) -> str:
         """Normalizes path for graph keys."""
@@ -701,10 +836,8 @@ class LinkDisplayer:
                 target_key = self._normalize_path(target_path)
                 
                 # Record File Graph
-                if target_key not in self.graph[source_key]:
-                    self.graph[source_key].append(target_key)
-                if source_key not in self.reverse_graph[target_key]:
-                    self.reverse_graph[target_key].append(source_key)
+                self.graph[source_key][target_key] = None
+                self.reverse_graph[target_key][source_key] = None
                 
                 self.discovered_files.add(target_key)
                 self.file_to_dir[target_key] = target_dir
@@ -792,7 +925,7 @@ class LinkDisplayer:
                 logger.info(f"{child_prefix}{connector}[{inc}] {filename} [{out}]")
                 
                 # Print Outgoing Links (Compact View)
-                targets = self.graph.get(file_key, [])
+                targets = list(self.graph.get(file_key, ()))
                 if targets:
                     link_indent = child_prefix + ("    " if is_last_item else "|   ")
                     for j, target in enumerate(targets):
@@ -899,7 +1032,7 @@ def _load_yaml_for_linking(path: Path) -> Optional[Dict]:
         return {'allowed_targets': [], 'established_links': {}}
     try:
         with open(path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=YamlLoader)
             if data is None: data = {}
             data.setdefault('allowed_targets', [])
             data.setdefault('established_links', {})
@@ -913,7 +1046,7 @@ def _save_yaml_for_linking(path: Path, data: Dict) -> bool:
     try:
         path.parent.mkdir(parents=True, exist_ok=True)
         with open(path, 'w', encoding='utf-8') as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False, indent=2)
+            yaml.dump(data, f, Dumper=YamlDumper, default_flow_style=False, sort_keys=False, indent=2)
         logger.info(f"[INFO] Updated {path}")
     except Exception as e:
         logger.error(f"[FATAL] Failed to write YAML to {path}: {e}")
@@ -948,7 +1081,7 @@ def _add_force_rule(yaml_data: Dict, source_dir: Path, target_path: Path, yaml_p
     relative_target_dir = Path(os.path.relpath(target_dir, source_dir)).as_posix()
 
     if target_filename.endswith('.md'):
-        generated_regex = r'.*\.md$'
+        generated_regex = MARKDOWN_FILENAME_REGEX
     else:
         generated_regex = re.escape(target_filename)
     
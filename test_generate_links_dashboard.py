@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Tests for the enhanced dashboard generator
+Run with: pytest test_generate_links_dashboard.py -v
+"""
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+from generate_links_dashboard import EnhancedDashboardGenerator
+
+ROOT = Path(__file__).resolve().parent
+
+
+class TestUpToDateCheck:
+    """The up-to-date check must notice every change to the inputs"""
+
+    def setup_method(self):
+        """Copy the repository's documents and verification results into a temp project"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.project_dir = Path(self.temp_dir)
+        for layer in EnhancedDashboardGenerator.HIERARCHY:
+            shutil.copytree(ROOT / layer, self.project_dir / layer)
+        shutil.copytree(ROOT / 'dashboard' / 'categories', self.project_dir / 'dashboard' / 'categories')
+        self.output_file = self.project_dir / 'dashboard' / 'enhanced-dashboard.html'
+
+    def teardown_method(self):
+        """Clean up the temp project"""
+        shutil.rmtree(self.temp_dir)
+
+    def generate(self):
+        generator = EnhancedDashboardGenerator(self.project_dir, self.output_file)
+        assert generator.run() == 0
+        return generator
+
+    def backdate_inputs(self):
+        """Make every input older than the outputs written next"""
+        for path in [self.project_dir, *self.project_dir.rglob('*')]:
+            os.utime(path, (0, 0))
+
+    def test_unchanged_project_is_up_to_date(self):
+        self.backdate_inputs()
+        generator = self.generate()
+        assert generator.is_up_to_date(self.output_file, generator.stylesheet_file)
+
+    def test_deleted_category_regenerates_dashboard(self):
+        self.backdate_inputs()
+        generator = self.generate()
+        assert 'cloud-alignment.html' in self.output_file.read_text(encoding='utf-8')
+
+        shutil.rmtree(self.project_dir / 'dashboard' / 'categories' / 'development')
+
+        generator = EnhancedDashboardGenerator(self.project_dir, self.output_file)
+        assert not generator.is_up_to_date(self.output_file, generator.stylesheet_file)
+        self.generate()
+        assert 'cloud-alignment.html' not in self.output_file.read_text(encoding='utf-8')
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Tests for the Gherkin Runner markdown scanner
+Run with: pytest test_gherkin_runner.py -v
+"""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent
+
+spec = importlib.util.spec_from_file_location("gherkin_runner", ROOT / "gherkin-runner.py")
+gherkin_runner = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(gherkin_runner)
+
+
+class TestScanMarkdown:
+    """scan_markdown must agree with the markdown-it based parse_markdown"""
+
+    @pytest.mark.parametrize("content, category", [
+        ("**Category**: ops\n", "ops"),
+        ("# Title\n**Category**: ops\n", "ops"),
+        ("Title\n===\n**Category**: ops\n", "ops"),
+        ("Title\n---\n**Category**: ops\n", "ops"),
+        ("---\n**Category**: ops\n", "ops"),
+        ("* * *\n**Category**: ops\n", "ops"),
+        ("- **Category**: ops\n", "ops"),
+        ("Some text\n**Category**: ops\n", None),
+        ("    **Category**: ops\n", None),
+        ("\tcode\n    **Category**: ops\n", None),
+        ("    code\n**Category**: ops\n", "ops"),
+        ("- item\n\n    **Category**: ops\n", "ops"),
+    ])
+    def test_category(self, content, category):
+        assert gherkin_runner.scan_markdown(content)[1] == category
+        assert gherkin_runner.parse_markdown(content)[1] == category
+
+    def test_gherkin_block(self):
+        content = "# Title\n\n```gherkin\nFeature: x\n```\n\n**Category**: ops\n"
+        assert gherkin_runner.scan_markdown(content) == gherkin_runner.parse_markdown(content)
+
+    @pytest.mark.parametrize("markdown_file", sorted((ROOT / "verification").glob("*.md")),
+                             ids=lambda path: path.name)
+    def test_repository_documents(self, markdown_file):
+        content = markdown_file.read_text(encoding='utf-8')
+        assert gherkin_runner.scan_markdown(content) == gherkin_runner.parse_markdown(content)
+
+
+class TestNormalizeGherkinKeywords:
+    """Keywords are rewritten to the Title Case the parser expects"""
+
+    @pytest.mark.parametrize("text, expected", [
+        ("FEATURE: x", "Feature: x"),
+        ("  scenario: y", "  Scenario: y"),
+        ("    GIVEN x", "    Given x"),
+        ("    Given\tx", "    Given x"),
+        ("    THEN\t y", "    Then  y"),
+        ("    Andrew is here", "    Andrew is here"),
+    ])
+    def test_keyword(self, text, expected):
+        assert gherkin_runner.normalize_gherkin_keywords(text) == expected